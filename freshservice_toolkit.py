@@ -20,19 +20,6 @@ import argparse
 import base64
 from typing import Dict, List, Optional, Tuple, Any
 
-# Core modules - make imports optional with fallbacks
-try:
-    from tabulate import tabulate
-    TABULATE_AVAILABLE = True
-except ImportError:
-    TABULATE_AVAILABLE = False
-
-try:
-    from colorama import init, Fore, Style
-    COLORAMA_AVAILABLE = True
-except ImportError:
-    COLORAMA_AVAILABLE = False
-
 # Try to import keyring, but don't fail if it's not available
 try:
     import keyring
@@ -654,7 +641,7 @@ def edit_first_name(user: Dict[str, Any], user_manager: UserManager) -> None:
     if confirmation == 'y':
         print_colored(f"Updating first name to '{new_name}'...", "blue")
         
-        updated_user = user_manager.update_user(user_id, {'first_name': new_name})
+        updated_user = user_manager.update_user(user_id, {'first_name': new_name}, user_hint=user)
         
         if updated_user:
             print_colored("✅ First name updated successfully.", "green")
@@ -689,7 +676,7 @@ def edit_last_name(user: Dict[str, Any], user_manager: UserManager) -> None:
     if confirmation == 'y':
         print_colored(f"Updating last name to '{new_name}'...", "blue")
         
-        updated_user = user_manager.update_user(user_id, {'last_name': new_name})
+        updated_user = user_manager.update_user(user_id, {'last_name': new_name}, user_hint=user)
         
         if updated_user:
             print_colored("✅ Last name updated successfully.", "green")
@@ -760,7 +747,8 @@ def edit_department(user: Dict[str, Any], user_manager: UserManager, department_
                     
                     updated_user = user_manager.update_user(
                         user_id, 
-                        {'department_ids': [dept_id]}
+                        {'department_ids': [dept_id]},
+                        user_hint=user
                     )
                     
                     if updated_user:
@@ -865,7 +853,8 @@ def edit_reporting_manager(user: Dict[str, Any], user_manager: UserManager, depa
             
             updated_user = user_manager.update_user(
                 user_id, 
-                {'reporting_manager_id': None}
+                {'reporting_manager_id': None},
+                user_hint=user
             )
             
             if updated_user:
@@ -896,7 +885,8 @@ def edit_reporting_manager(user: Dict[str, Any], user_manager: UserManager, depa
         
         updated_user = user_manager.update_user(
             user_id, 
-            {'reporting_manager_id': new_manager.get('id')}
+            {'reporting_manager_id': new_manager.get('id')},
+            user_hint=user
         )
         
         if updated_user:
@@ -969,7 +959,7 @@ def edit_multiple_fields(user: Dict[str, Any], user_manager: UserManager, depart
         print_colored("Updating user information...", "blue")
         
         # Update the user
-        updated_user = user_manager.update_user(user_id, update_data)
+        updated_user = user_manager.update_user(user_id, update_data, user_hint=user)
         
         if updated_user:
             print_colored("✅ User information updated successfully.", "green")
@@ -1112,7 +1102,7 @@ def view_recent_users(user_manager: UserManager, department_manager: DepartmentM
     """View recently accessed users."""
     print_colored("\n📜 Recent Users", "blue")
     
-    recent_users = user_manager.recent_users
+    recent_users = user_manager.get_recent_users()
     
     if not recent_users:
         print_colored("No recent users found.", "yellow")
@@ -1233,7 +1223,8 @@ def update_departments_from_csv(user_manager, department_manager, csv_processor)
                 # Update user
                 updated_user = user_manager.update_user(
                     user_id, 
-                    {'department_ids': [department_id]}
+                    {'department_ids': [department_id]},
+                    user_hint=user
                 )
                 
                 if updated_user:
@@ -2100,9 +2091,9 @@ def inactive_accounts_report(user_manager, csv_processor):
         print_colored("\nInactive Users Summary:", "green")
         print_colored(f"Total Inactive Users: {len(inactive_users)}", "yellow")
         if include_agents:
-            print_colored(f"Inactive Agents: {summary.get('inactive_agents')} of {summary.get('total_agents_checked')} checked", "yellow")
+            print_colored(f"Inactive Agents: {summary.get('inactive_agents')} of {summary.get('agents_older_than_threshold')} created more than {threshold_days} days ago", "yellow")
         if include_requesters:
-            print_colored(f"Inactive Requesters: {summary.get('inactive_requesters')} of {summary.get('total_requesters_checked')} checked", "yellow")
+            print_colored(f"Inactive Requesters: {summary.get('inactive_requesters')} of {summary.get('requesters_older_than_threshold')} created more than {threshold_days} days ago", "yellow")
         print_colored(f"Users Without Login Data: {summary.get('users_without_login_data')}", "yellow")
         print_colored(f"Inactivity Threshold: {threshold_days} days", "yellow")
         print_colored(f"Execution Time: {summary.get('execution_time_seconds', 0):.2f} seconds", "yellow")
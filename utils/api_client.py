@@ -11,9 +11,45 @@ import base64
 import json
 import logging
 import time
+import threading
+from collections import deque
 from typing import Dict, List, Optional, Any, Union
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
+
+# Use orjson for parsing responses when it's installed, it's much faster on large pages
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+class APIRequestError(Exception):
+    """An error response from the API; status_code holds the HTTP status."""
+    
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class _ExpectedNotFound(APIRequestError):
+    """A 404 the caller asked for (quiet_404), raised without error logging."""
+
+
+def is_not_found_error(error: Exception) -> bool:
+    """
+    Check whether an exception from the API client is a 404 response.
+    
+    Args:
+        error: Exception raised by a request
+        
+    Returns:
+        True only for a 404 status; network errors, timeouts and other statuses are False
+    """
+    return getattr(error, 'status_code', None) == 404
 
 
 class FreshServiceAPI:
@@ -27,6 +63,10 @@ class FreshServiceAPI:
     # Rate limiting: 50 requests per minute (as per FreshService API documentation)
     RATE_LIMIT = 50
     RATE_LIMIT_WINDOW = 60  # 60 seconds (1 minute)
+    # Keep-alive connections pooled per host (covers the concurrent report workers)
+    HTTP_POOL_SIZE = 16
+    # Transient gateway errors retried by the HTTP adapter (429 is handled in _make_request)
+    RETRY_STATUS_CODES = (502, 503, 504)
     # Endpoints that don't need workspace prefix
     NON_WORKSPACE_ENDPOINTS = [
         "requesters", "agents", "departments", "groups", "roles",
@@ -51,8 +91,44 @@ class FreshServiceAPI:
         self.logger.info(f"API Base URL: {self.BASE_URL}")
         self.auth_header = self._get_auth_header()
         
-        # Rate limiting tracking
-        self.request_timestamps = []
+        # Rate limiting tracking (shared by concurrent report requests)
+        self.request_timestamps = deque()  # Oldest first
+        self._rate_limit_lock = threading.Lock()
+        # Latest rate limit budget reported by the server (None until a response carries it)
+        self.rate_limit_remaining = None
+        self.rate_limit_retry_after = None
+        # Pagination and cache headers from the latest response, kept per thread for concurrent fetches
+        self._response_state = threading.local()
+        
+        # Reuse TCP/TLS connections across requests instead of reconnecting each time
+        self._session = self._create_session()
+    
+    def _create_session(self) -> requests.Session:
+        """
+        Create the HTTP session shared by all requests from this client.
+        
+        Connection failures and transient gateway errors (502/503/504) on
+        idempotent requests are retried with a short backoff; other HTTP error
+        statuses, including 429, are left to _make_request.
+        
+        Returns:
+            Configured requests.Session
+        """
+        session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=self.RETRY_STATUS_CODES,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.HTTP_POOL_SIZE,
+            pool_maxsize=self.HTTP_POOL_SIZE,
+            max_retries=retry
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
     
     def _extract_domain_from_key(self) -> str:
         """
@@ -108,25 +184,106 @@ class FreshServiceAPI:
     def _check_rate_limit(self) -> None:
         """
         Enforce rate limiting to avoid API throttling.
-        Sleeps if necessary to stay within rate limits.
+        Sleeps if necessary to stay within rate limits, then records the request.
+        Checking and recording happen under one lock so concurrent requests share one window.
         """
-        now = time.time()
-        
-        # Remove timestamps older than the window
-        window_start = now - self.RATE_LIMIT_WINDOW
-        self.request_timestamps = [ts for ts in self.request_timestamps if ts > window_start]
-        
-        # Check if we're at the limit
-        if len(self.request_timestamps) >= self.RATE_LIMIT:
-            # Calculate how long to wait
-            oldest_request = min(self.request_timestamps)
-            wait_time = self.RATE_LIMIT_WINDOW - (now - oldest_request)
+        with self._rate_limit_lock:
+            timestamps = self.request_timestamps
+            now = time.time()
+            
+            # Remove timestamps older than the window (in place, oldest first)
+            window_start = now - self.RATE_LIMIT_WINDOW
+            while timestamps and timestamps[0] <= window_start:
+                timestamps.popleft()
+            
+            # Check if we're at the limit
+            if len(timestamps) >= self.RATE_LIMIT:
+                # Calculate how long to wait
+                oldest_request = timestamps[0]
+                wait_time = self.RATE_LIMIT_WINDOW - (now - oldest_request)
+                
+                if wait_time > 0:
+                    # Log at debug level to avoid cluttering console
+                    self.logger.debug(f"Rate limit reached. Waiting {wait_time:.2f} seconds.")
+                    time.sleep(wait_time)
+                timestamps.popleft()
             
-            if wait_time > 0:
-                # Log at debug level to avoid cluttering console
-                self.logger.debug(f"Rate limit reached. Waiting {wait_time:.2f} seconds.")
-                time.sleep(wait_time)
+            # Track this request
+            timestamps.append(time.time())
 
+    def _record_rate_limit_headers(self, response) -> None:
+        """
+        Remember the rate limit budget advertised in a response's headers.
+        
+        Args:
+            response: Response object from requests
+        """
+        try:
+            remaining = response.headers.get('X-Ratelimit-Remaining')
+            if remaining is not None:
+                self.rate_limit_remaining = int(remaining)
+            
+            retry_after = response.headers.get('Retry-After')
+            self.rate_limit_retry_after = int(retry_after) if retry_after is not None else None
+        except (AttributeError, TypeError, ValueError):
+            pass
+    
+    def _record_response_headers(self, response) -> None:
+        """
+        Remember a response's ETag and whether its Link header points at a next page.
+        
+        Args:
+            response: Response object from requests
+        """
+        try:
+            self._response_state.has_next = 'next' in response.links
+            self._response_state.etag = response.headers.get('ETag')
+        except AttributeError:
+            self._response_state.has_next = None
+            self._response_state.etag = None
+    
+    def last_response_has_next_page(self) -> Optional[bool]:
+        """
+        Report whether the latest response on this thread advertised a next page.
+        
+        Returns:
+            True or False from the Link header, or None if unknown (no response yet or dry run)
+        """
+        return getattr(self._response_state, 'has_next', None)
+    
+    def last_response_etag(self) -> Optional[str]:
+        """
+        Get the ETag of the latest response on this thread.
+        
+        Returns:
+            The ETag header value, or None if the response had none
+        """
+        return getattr(self._response_state, 'etag', None)
+    
+    def wait_for_rate_limit_budget(self, low_water: int = 5, soft_limit: int = 20, soft_wait: float = 2.0) -> None:
+        """
+        Pause before a burst of requests if the server says the budget is running low.
+        
+        Args:
+            low_water: At or below this many remaining requests, wait for the window to reset
+            soft_limit: At or below this many remaining requests, pause briefly
+            soft_wait: Length of the brief pause in seconds
+        """
+        remaining = self.rate_limit_remaining
+        
+        # Without server feedback, fall back to a short fixed pause
+        if remaining is None:
+            time.sleep(soft_wait)
+            return
+        
+        if remaining <= low_water:
+            wait_time = self.rate_limit_retry_after or self.RATE_LIMIT_WINDOW
+            self.logger.debug(f"Only {remaining} requests left in rate limit window. Waiting {wait_time} seconds.")
+            time.sleep(wait_time)
+        elif remaining <= soft_limit:
+            self.logger.debug(f"{remaining} requests left in rate limit window. Waiting {soft_wait} seconds.")
+            time.sleep(soft_wait)
+    
     def _make_request(
         self, 
         method: str, 
@@ -135,6 +292,8 @@ class FreshServiceAPI:
         params: Optional[Dict] = None,
         workspace_id: Optional[int] = None,
         expect_no_content: bool = False,
+        etag: Optional[str] = None,
+        quiet_404: bool = False,
         _diagnostic: bool = False
     ) -> Dict:
         """
@@ -147,6 +306,8 @@ class FreshServiceAPI:
             params: URL parameters
             workspace_id: Optional workspace ID
             expect_no_content: If True, handle 204 No Content responses as success
+            etag: If set, sent as If-None-Match; a 304 reply returns {"not_modified": True}
+            quiet_404: If True, a 404 is an expected outcome: it still raises, but is only logged at DEBUG
             _diagnostic: If True, captures and returns more detailed error information
             
         Returns:
@@ -155,9 +316,6 @@ class FreshServiceAPI:
         Raises:
             Exception on API error or rate limiting
         """
-        # Rate limiting check
-        self._check_rate_limit()
-        
         # Add workspace ID to the endpoint if provided and needed
         workspace_endpoint = endpoint
         if workspace_id is not None:
@@ -203,8 +361,8 @@ class FreshServiceAPI:
             return {"dry_run": True, "success": True, "message": "This is a dry run"}
         
         try:
-            # Track this request
-            self.request_timestamps.append(time.time())
+            # Rate limiting check (also records this request)
+            self._check_rate_limit()
             
             # Handle JSON data
             json_data = None
@@ -217,16 +375,22 @@ class FreshServiceAPI:
                 self.logger.debug(f"Request headers: {self.auth_header}")
                 self.logger.debug(f"Request payload: {json.dumps(json_data)}")
             
-            response = requests.request(
+            response = self._session.request(
                 method=method,
                 url=url,
-                headers=self.auth_header,
+                headers={**self.auth_header, 'If-None-Match': etag} if etag else self.auth_header,
                 params=params,
                 json=json_data
             )
             
             # Log response info for debugging only
             self.logger.debug(f"Response status: {response.status_code}")
+            self._record_rate_limit_headers(response)
+            self._record_response_headers(response)
+            if quiet_404 and response.status_code == 404:
+                # An expected outcome for the caller, so keep it out of the error logs
+                self.logger.debug(f"404 Not Found for url: {url}")
+                raise _ExpectedNotFound(f"404 Not Found for url: {url}", 404)
             if response.status_code >= 400:  # Only log errors at INFO level
                 self.logger.info(f"Error response: {response.status_code} for {method} {url}")
             
@@ -235,6 +399,11 @@ class FreshServiceAPI:
                 self.logger.debug(f"Request to {url} succeeded with status 204 No Content")
                 return True
             
+            # The resource hasn't changed since the ETag we sent
+            if etag and response.status_code == 304:
+                self.logger.debug(f"Request to {url} not modified (304)")
+                return {"not_modified": True}
+            
             # Log response for debugging PUT/POST requests
             if method in ['PUT', 'POST']:
                 try:
@@ -263,7 +432,7 @@ class FreshServiceAPI:
                                 'response': {'audit_logs': []}
                             }
                         # For non-diagnostic calls, raise a more helpful exception
-                        raise Exception(error_message)
+                        raise APIRequestError(error_message, 404)
                 
                 try:
                     error_details = response.json()
@@ -296,19 +465,21 @@ class FreshServiceAPI:
                         'response': error_details
                     }
                     
-                raise Exception(error_message)
+                raise APIRequestError(error_message, response.status_code)
             
             # Parse the response
             response_json = {}
-            if response.text:
+            if response.content:
                 try:
-                    response_json = response.json()
+                    response_json = _json_loads(response.content)
                 except ValueError:
                     # If response is not JSON, return the raw text
                     return {"text": response.text}
             
             return response_json
             
+        except _ExpectedNotFound:
+            raise
         except Exception as e:
             # Calculate time spent on this request
             request_time = time.time() - request_start
@@ -349,7 +520,9 @@ class FreshServiceAPI:
         self, 
         endpoint: str, 
         params: Optional[Dict[str, Any]] = None,
-        workspace_id: Optional[int] = None
+        workspace_id: Optional[int] = None,
+        etag: Optional[str] = None,
+        quiet_404: bool = False
     ) -> Dict[str, Any]:
         """
         Send a GET request to the FreshService API.
@@ -358,11 +531,16 @@ class FreshServiceAPI:
             endpoint: API endpoint to call
             params: Query parameters
             workspace_id: Workspace ID for scoped requests
+            etag: ETag from an earlier response; if the resource is unchanged
+                the server answers 304 and {"not_modified": True} is returned
+            quiet_404: If True, a 404 (e.g. probing whether a user exists) is not logged as an error
             
         Returns:
             Response data as dictionary
         """
-        return self._make_request('GET', endpoint, params=params, workspace_id=workspace_id)
+        return self._make_request(
+            'GET', endpoint, params=params, workspace_id=workspace_id, etag=etag, quiet_404=quiet_404
+        )
     
     def post(
         self, 
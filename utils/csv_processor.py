@@ -10,8 +10,12 @@ Handles CSV file processing for bulk user operations.
 import csv
 import logging
 import os
+import re
 from typing import Dict, List, Optional, Any, Tuple
 
+# Email pattern used to validate CSV rows, compiled once at import
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', re.ASCII)
+
 
 class CSVProcessor:
     """
@@ -286,6 +290,4 @@ class CSVProcessor:
         Returns:
             True if valid, False otherwise
         """
-        import re
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(email_pattern, email)) 
\ No newline at end of file
+        return _EMAIL_RE.match(email) is not None 
\ No newline at end of file
@@ -15,19 +15,81 @@ import platform
 import shutil
 from typing import Optional
 
-# Try to import colorama, but don't fail if it's not available
-try:
-    import colorama
-    COLORAMA_AVAILABLE = True
-except ImportError:
-    COLORAMA_AVAILABLE = False
+# Toolkit paths, resolved once at import
+_SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_LOG_DIR = os.path.join(_SCRIPT_DIR, 'logs')
+_VENV_DIR = os.path.join(_SCRIPT_DIR, 'venv')
+_REQUIREMENTS_FILE = os.path.join(_SCRIPT_DIR, 'requirements.txt')
 
-# Check for tabulate
+# Create logs directory up front so setup_logging doesn't have to
 try:
-    import tabulate as tabulate_module
-    TABULATE_AVAILABLE = True
-except ImportError:
-    TABULATE_AVAILABLE = False
+    os.makedirs(_LOG_DIR, exist_ok=True)
+except OSError:
+    pass
+
+# Loggers whose non-error records are kept off the console
+_SILENT_LOGGERS = frozenset({
+    "requests", "urllib3", "freshservice_toolkit",
+    "utils.api_client", "utils.user_manager", "utils.department_manager",
+    "utils.workspace_manager", "utils.csv_processor", "utils.reports"
+})
+
+# Optional modules are imported on first use to keep startup cheap.
+# None means "not tried yet", False means "tried and unavailable".
+_colorama = None
+_tabulate = None
+
+
+def _get_colorama():
+    """
+    Import and initialize colorama on first use.
+    
+    Returns:
+        The colorama module, or None if it is not installed
+    """
+    global _colorama
+    if _colorama is False:
+        return None
+    if _colorama is None:
+        try:
+            import colorama as colorama_module
+            colorama_module.init()
+            _colorama = colorama_module
+        except ImportError:
+            _colorama = False
+            return None
+    return _colorama
+
+
+def _get_tabulate():
+    """
+    Import tabulate on first use.
+    
+    Returns:
+        The tabulate module, or None if it is not installed
+    """
+    global _tabulate
+    if _tabulate is False:
+        return None
+    if _tabulate is None:
+        try:
+            import tabulate as tabulate_module
+            _tabulate = tabulate_module
+        except ImportError:
+            _tabulate = False
+            return None
+    return _tabulate
+
+
+class _SilentLoggersFilter(logging.Filter):
+    """Drop non-error records coming from the silenced loggers."""
+    
+    def __init__(self, names=_SILENT_LOGGERS):
+        super().__init__()
+        self.names = set(names)
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.ERROR or record.name not in self.names
 
 
 def setup_logging(log_level: int = logging.INFO) -> logging.Logger:
@@ -43,10 +105,6 @@ def setup_logging(log_level: int = logging.INFO) -> logging.Logger:
     # First, configure the root logger to ERROR to prevent any INFO messages in console
     logging.basicConfig(level=logging.ERROR)
     
-    # Create logs directory if it doesn't exist
-    log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'logs')
-    os.makedirs(log_dir, exist_ok=True)
-    
     # Configure logging
     logger = logging.getLogger('freshservice_toolkit')
     logger.setLevel(log_level)
@@ -56,7 +114,7 @@ def setup_logging(log_level: int = logging.INFO) -> logging.Logger:
         logger.handlers.clear()
     
     # Create file handler - detailed logging to file
-    log_file = os.path.join(log_dir, 'freshservice_toolkit.log')
+    log_file = os.path.join(_LOG_DIR, 'freshservice_toolkit.log')
     file_handler = logging.FileHandler(log_file)
     file_handler.setLevel(log_level)
     
@@ -64,6 +122,12 @@ def setup_logging(log_level: int = logging.INFO) -> logging.Logger:
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.ERROR)  # Only errors to console
     
+    # Disable all non-error console output for related modules
+    silent_filter = _SilentLoggersFilter()
+    console_handler.addFilter(silent_filter)
+    for root_handler in logging.getLogger().handlers:
+        root_handler.addFilter(silent_filter)
+    
     # Create formatter
     file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     console_formatter = logging.Formatter('%(levelname)s: %(message)s')  # Simplified format for console
@@ -78,12 +142,6 @@ def setup_logging(log_level: int = logging.INFO) -> logging.Logger:
     # Prevent propagation to parent loggers (important to avoid duplicate logs)
     logger.propagate = False
     
-    # Disable all non-error logs for related modules
-    for module in ["requests", "urllib3", "freshservice_toolkit", 
-                  "utils.api_client", "utils.user_manager", "utils.department_manager",
-                  "utils.workspace_manager", "utils.csv_processor", "utils.reports"]:
-        logging.getLogger(module).setLevel(logging.ERROR)
-    
     # Only have detailed logs in the file, not console
     logger.info("Logging initialized")
     return logger
@@ -96,10 +154,8 @@ def setup_virtual_env() -> bool:
     Returns:
         True if successful, False otherwise
     """
-    # Get script directory
-    script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    venv_dir = os.path.join(script_dir, 'venv')
-    requirements_file = os.path.join(script_dir, 'requirements.txt')
+    venv_dir = _VENV_DIR
+    requirements_file = _REQUIREMENTS_FILE
     
     # Check if virtual environment already exists
     if os.path.exists(venv_dir):
@@ -157,14 +213,13 @@ def print_colored(text: str, color: str, bold: bool = False) -> None:
         color: Color to use ('red', 'green', 'yellow', 'blue', 'cyan', 'magenta')
         bold: Whether to print in bold
     """
-    if not COLORAMA_AVAILABLE:
+    colorama = _get_colorama()
+    if colorama is None:
         # Fallback if colorama is not installed
         print(text)
         return
         
     try:
-        colorama.init()
-        
         colors = {
             'red': colorama.Fore.RED,
             'green': colorama.Fore.GREEN,
@@ -306,21 +361,17 @@ def is_valid_file_path(path: str) -> bool:
     """
     try:
         # Check if directory part exists
-        dir_name = os.path.dirname(path)
-        if dir_name and not os.path.isdir(dir_name):
+        dir_name = os.path.dirname(path) or '.'
+        if not os.path.isdir(dir_name):
             return False
-        
-        # Try to create a test file
-        if not os.path.isdir(path):
-            with open(path, 'a'):
-                pass
-            
-            # Delete the file if it was created
-            if os.path.exists(path) and not os.path.getsize(path):
-                os.remove(path)
-                
-        return True
-    except (OSError, IOError):
+
+        # Existing files must be regular files we can write to
+        if os.path.exists(path):
+            return not os.path.isdir(path) and os.access(path, os.W_OK)
+
+        # New files can be created if the directory is writable
+        return os.access(dir_name, os.W_OK)
+    except (OSError, IOError, TypeError, ValueError):
         return False
 
 
@@ -336,7 +387,8 @@ def use_tabulate(table_data, headers, tablefmt="grid"):
     Returns:
         Formatted table string
     """
-    if TABULATE_AVAILABLE:
+    tabulate_module = _get_tabulate()
+    if tabulate_module is not None:
         return tabulate_module.tabulate(table_data, headers=headers, tablefmt=tablefmt)
     else:
         # Convert data to list of dicts if not already
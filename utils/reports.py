@@ -9,17 +9,309 @@ through ticket interactions.
 """
 
 import os
+import re
 import csv
 import logging
 import datetime
 import time
+import heapq
+import io
+import gzip
+import sqlite3
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter, itemgetter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Any, Tuple
 
+from .api_client import is_not_found_error
+
+# HTML entities replaced when cleaning conversation bodies
+_HTML_ENTITIES = {
+    '&nbsp;': ' ',
+    '&amp;': '&',
+    '&lt;': '<',
+    '&gt;': '>',
+    '&quot;': '"',
+    '&apos;': "'",
+    '&#39;': "'",
+    '&ndash;': '-',
+    '&mdash;': '--'
+}
+# Matches the entities above plus <br>/</div>/</p> tags, which all become a space
+_ENTITY_RE = re.compile(
+    r'&(?:nbsp|amp|lt|gt|quot|apos|#39|ndash|mdash);|<br\s*/?>|</(?:div|p)>',
+    re.IGNORECASE
+)
+_BLOCK_TAG_RE = re.compile(r'<(div|p)[^>]*>', re.IGNORECASE)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# First three-digit number in an error message, taken as the HTTP status code
+_STATUS_CODE_RE = re.compile(r'\d{3}')
+
+# On-disk cache of last login lookups, shared between toolkit runs
+_ACTIVITY_CACHE_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'freshservice-toolkit', 'user_activity.db'
+)
+
+# Raw conversation bodies are cut to this length before HTML cleaning in CSV exports
+_MAX_RAW_BODY_LENGTH = 4000
+
+# Human-readable ticket status and priority labels
+_STATUS_MAP = {
+    1: "Open",
+    2: "Pending",
+    3: "Resolved",
+    4: "Closed", 
+    5: "New",
+    6: "In Progress",
+    7: "On Hold"
+}
+
+_PRIORITY_MAP = {
+    1: "Low",
+    2: "Medium",
+    3: "High",
+    4: "Urgent"
+}
+
+# Display labels for activity roles
+_ROLE_LABELS = {
+    'agent': 'Agent',
+    'requester': 'Requester'
+}
+
+# Padded day-of-week labels for the activity visualization (Monday = 0)
+_DAY_NAMES = (
+    "Monday   ",
+    "Tuesday  ",
+    "Wednesday",
+    "Thursday ",
+    "Friday   ",
+    "Saturday ",
+    "Sunday   "
+)
+
+# Ticket fields copied into activity items, extracted in a single call
+_TICKET_FIELDS = itemgetter('id', 'subject', 'status', 'priority', 'created_at', 'updated_at')
+
+
+def _extract_ticket_fields(ticket: Dict) -> Tuple:
+    """
+    Extract (id, subject, status, priority, created_at, updated_at) from a ticket.
+    
+    Falls back to per-field defaults when the ticket is missing any of them.
+    """
+    try:
+        return _TICKET_FIELDS(ticket)
+    except KeyError:
+        return (
+            ticket.get('id'),
+            ticket.get('subject', 'No subject'),
+            ticket.get('status', 'Unknown'),
+            ticket.get('priority', 'Unknown'),
+            ticket.get('created_at'),
+            ticket.get('updated_at')
+        )
+
+
+def _parse_iso_datetime(date_str: str) -> datetime.datetime:
+    """
+    Parse a FreshService timestamp (YYYY-MM-DDTHH:MM:SSZ) into a naive datetime.
+    
+    Raises:
+        ValueError if the string is not a valid ISO timestamp
+    """
+    if date_str.endswith('Z'):
+        date_str = date_str[:-1]
+    return datetime.datetime.fromisoformat(date_str)
+
+
+@lru_cache(maxsize=4096)
+def _format_inactive_user_date(date_str: Optional[str]) -> str:
+    """
+    Format a FreshService timestamp for the inactive users CSV.
+    
+    Cached because many users share creation and login timestamps.
+    
+    Returns:
+        'YYYY-MM-DD HH:MM:SS', "Never" for missing values, or the input if unparseable
+    """
+    if not date_str:
+        return "Never"
+        
+    try:
+        return _parse_iso_datetime(date_str).strftime("%Y-%m-%d %H:%M:%S")
+    except Exception:
+        return date_str
+
+
+def _iso_to_epoch(date_str: Optional[str]) -> float:
+    """
+    Convert a FreshService UTC timestamp to epoch seconds for sorting.
+    
+    Returns:
+        Epoch seconds, or 0.0 if the value is missing or unparseable
+    """
+    if not date_str:
+        return 0.0
+    try:
+        return _parse_iso_datetime(date_str).replace(tzinfo=datetime.timezone.utc).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def _is_same_id(value: Any, target_id: Any, target_id_str: Optional[str] = None) -> bool:
+    """
+    Check whether an ID from the API refers to target_id, which may be an int or a string.
+    
+    Args:
+        value: ID value from an API record (may be None)
+        target_id: ID to compare against
+        target_id_str: str(target_id), precomputed by callers comparing in a loop
+        
+    Returns:
+        True if the IDs match
+    """
+    # Same-type comparison first, string comparison only on a type mismatch
+    if value is None:
+        return False
+    if value == target_id:
+        return True
+    return str(value) == (target_id_str if target_id_str is not None else str(target_id))
+
+
+class ActivityItem:
+    """
+    A single ticket or conversation entry in an activity report.
+    
+    Uses __slots__ instead of a per-item dict. Fields that don't apply to an item
+    (e.g. 'subject' on a conversation) are left unset, and get() mirrors dict.get
+    so report consumers can read items the same way as plain dictionaries.
+    """
+    
+    __slots__ = (
+        'ticket_id', 'type', 'created_at', 'updated_at', '_ts',
+        'subject', 'status', 'priority',
+        'conversation_id', 'body', 'user_id',
+        'role', 'agent_role', 'conversation_type'
+    )
+    
+    def __init__(self, **fields):
+        for name, value in fields.items():
+            setattr(self, name, value)
+    
+    def get(self, name: str, default: Any = None) -> Any:
+        """Return a field value, or default if the field is not set."""
+        return getattr(self, name, default)
+    
+    def __contains__(self, name: str) -> bool:
+        return hasattr(self, name)
+    
+    def __repr__(self) -> str:
+        fields = {name: getattr(self, name) for name in self.__slots__ if hasattr(self, name)}
+        return f"ActivityItem({fields})"
+
+
+class InactiveUser:
+    """
+    A single agent or requester row in the inactive users report.
+    
+    Uses __slots__ instead of a per-user dict; get() mirrors dict.get so callers
+    can keep reading records the same way as before.
+    """
+    
+    __slots__ = (
+        'id', 'first_name', 'last_name', 'email', 'last_login',
+        'days_inactive', 'type', 'active', 'created_at', '_sort_days'
+    )
+    
+    def __init__(self, id, first_name, last_name, email, last_login,
+                 days_inactive, type, active, created_at):
+        self.id = id
+        self.first_name = first_name
+        self.last_name = last_name
+        self.email = email
+        self.last_login = last_login
+        self.days_inactive = days_inactive
+        self.type = type
+        self.active = active
+        self.created_at = created_at
+        # Numeric sort key; unknown inactivity sorts as most inactive
+        self._sort_days = 999999 if days_inactive == 'Unknown' else days_inactive
+    
+    def get(self, name: str, default: Any = None) -> Any:
+        """Return a field value, or default if the field doesn't exist."""
+        return getattr(self, name, default)
+    
+    def __contains__(self, name: str) -> bool:
+        return hasattr(self, name)
+    
+    def __repr__(self) -> str:
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        return f"InactiveUser({fields})"
+
+
+# Sort key for activity items (numeric creation time attached at build time)
+_ACTIVITY_SORT_KEY = attrgetter('_ts')
+
+# Sort key for inactive users (numeric days inactive attached at build time)
+_INACTIVE_SORT_KEY = attrgetter('_sort_days')
+
+# Pulls the InactiveUser fields used by the CSV export in a single C-level call
+_INACTIVE_USER_CSV_FIELDS = attrgetter(
+    'id', 'first_name', 'last_name', 'email', 'type',
+    'active', 'days_inactive', 'last_login', 'created_at'
+)
+
+# Column headers for the inactive users CSV
+_INACTIVE_USERS_CSV_HEADERS = (
+    'ID', 'First Name', 'Last Name', 'Email', 'Type',
+    'Account Status', 'Days Inactive', 'Last Login', 'Created At',
+    'Job Title', 'Department', 'Location'
+)
+
+# Column headers for the activity report CSV
+_ACTIVITY_CSV_HEADERS = (
+    'Date',
+    'Type',
+    'Ticket ID',
+    'Subject/Content',
+    'Status',
+    'Priority',
+    'Last Updated'
+)
+
+
 class ReportsManager:
     """
     Manages report generation for FreshService data.
     """
     
+    # Maximum number of concurrent conversation requests (kept low to respect rate limits)
+    CONVERSATION_FETCH_WORKERS = 8
+    # How long fetched ticket conversations stay cached (seconds)
+    CONVERSATION_CACHE_TTL = 60
+    # Most tickets whose conversations are kept; least recently used are dropped first
+    CONVERSATION_CACHE_SIZE = 2048
+    # Number of concurrent last-login lookups within an inactive users batch
+    LAST_LOGIN_FETCH_WORKERS = 8
+    # Number of list pages requested at once when paging through agents/requesters
+    PAGE_FETCH_WORKERS = 5
+    # How long last logins and agent/requester lists stay cached (seconds)
+    USER_CACHE_TTL = 300
+    # Most users whose last logins are kept, and most cached agent/requester lists
+    LAST_LOGIN_CACHE_SIZE = 10000
+    USER_LIST_CACHE_SIZE = 16
+    # How long last logins stay in the on-disk cache between runs (seconds)
+    LAST_LOGIN_DISK_CACHE_TTL = 6 * 60 * 60
+    # Rows handed to the CSV writer at once, and how often file exports are flushed
+    CSV_WRITE_CHUNK_ROWS = 1000
+    CSV_FLUSH_EVERY_ROWS = 10000
+    
     def __init__(self, api_client, workspace_id, logger=None):
         """
         Initialize the ReportsManager.
@@ -32,6 +324,169 @@ class ReportsManager:
         self.api_client = api_client
         self.workspace_id = workspace_id
         self.logger = logger or logging.getLogger(__name__)
+        # Cache of (workspace_id, ticket_id) -> (fetched_at, conversations), least recently used first
+        self._conv_cache: "OrderedDict[Tuple, Tuple[float, List[Dict]]]" = OrderedDict()
+        # Cache of user_id -> (fetched_at, last login string or None), least recently used first
+        self._last_login_cache: "OrderedDict[Any, Tuple[float, Optional[str]]]" = OrderedDict()
+        # Cache of (list endpoint, query) -> (fetched_at, records), least recently used first
+        self._user_list_cache: "OrderedDict[Tuple, Tuple[float, List[Dict]]]" = OrderedDict()
+        # Lazily opened sqlite connection for the on-disk last login cache
+        # (None = not opened yet, False = unavailable)
+        self._disk_cache = None
+        self._disk_cache_lock = threading.Lock()
+        # Guards the in-memory caches, which report worker threads read and fill
+        self._cache_lock = threading.Lock()
+    
+    def _cache_get(self, cache: OrderedDict, key: Any, ttl: float) -> Optional[Tuple[float, Any]]:
+        """
+        Look up a fresh entry in one of the bounded in-memory caches.
+        
+        Args:
+            cache: Cache to read
+            key: Cache key
+            ttl: Maximum age of a usable entry (seconds)
+            
+        Returns:
+            The (stored_at, value) entry, or None if missing or expired
+        """
+        with self._cache_lock:
+            entry = cache.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[0] >= ttl:
+                del cache[key]
+                return None
+            cache.move_to_end(key)
+            return entry
+    
+    def _cache_put(self, cache: OrderedDict, key: Any, value: Any, ttl: float, max_size: int) -> None:
+        """
+        Store a value in one of the bounded in-memory caches.
+        
+        Expired entries at the old end are swept out, then least recently used
+        entries are evicted until the cache fits max_size.
+        
+        Args:
+            cache: Cache to write
+            key: Cache key
+            value: Value to store
+            ttl: Maximum age of a usable entry (seconds)
+            max_size: Maximum number of entries
+        """
+        now = time.time()
+        with self._cache_lock:
+            cache[key] = (now, value)
+            cache.move_to_end(key)
+            while cache:
+                stored_at = next(iter(cache.values()))[0]
+                if now - stored_at < ttl and len(cache) <= max_size:
+                    break
+                cache.popitem(last=False)
+    
+    def clear_conversation_cache(self) -> None:
+        """Clear cached ticket conversations so the next report fetches fresh data."""
+        with self._cache_lock:
+            self._conv_cache.clear()
+    
+    def clear_user_cache(self) -> None:
+        """Clear cached last logins and agent/requester lists so the next report fetches fresh data."""
+        with self._cache_lock:
+            self._last_login_cache.clear()
+            self._user_list_cache.clear()
+        
+        connection = self._get_disk_cache()
+        if connection:
+            with self._disk_cache_lock:
+                try:
+                    with connection:
+                        connection.execute(
+                            'DELETE FROM last_login_cache WHERE domain = ?',
+                            (self._cache_domain(),)
+                        )
+                except sqlite3.Error as e:
+                    self.logger.warning(f"Could not clear last login disk cache: {str(e)}")
+    
+    def _cache_domain(self) -> str:
+        """Return the FreshService domain used to keep cached users from different tenants apart."""
+        return str(getattr(self.api_client, 'domain', '') or '')
+    
+    def _get_disk_cache(self):
+        """
+        Open the on-disk last login cache on first use.
+        
+        Returns:
+            sqlite3 connection, or None if the cache can't be used
+        """
+        if self._disk_cache is None:
+            with self._disk_cache_lock:
+                if self._disk_cache is None:
+                    try:
+                        os.makedirs(os.path.dirname(_ACTIVITY_CACHE_PATH), exist_ok=True)
+                        connection = sqlite3.connect(_ACTIVITY_CACHE_PATH, check_same_thread=False)
+                        connection.execute('PRAGMA journal_mode=WAL')
+                        connection.execute(
+                            'CREATE TABLE IF NOT EXISTS last_login_cache ('
+                            'domain TEXT NOT NULL, user_id TEXT NOT NULL, last_login TEXT, '
+                            'fetched_at REAL NOT NULL, PRIMARY KEY (domain, user_id))'
+                        )
+                        connection.commit()
+                        self._disk_cache = connection
+                    except (OSError, sqlite3.Error) as e:
+                        self.logger.warning(f"Last login disk cache unavailable: {str(e)}")
+                        self._disk_cache = False
+        
+        return self._disk_cache or None
+    
+    def _read_disk_last_login(self, user_id):
+        """
+        Look up a last login in the on-disk cache.
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            Tuple of (found, last_login)
+        """
+        connection = self._get_disk_cache()
+        if not connection:
+            return False, None
+        
+        with self._disk_cache_lock:
+            try:
+                row = connection.execute(
+                    'SELECT last_login, fetched_at FROM last_login_cache WHERE domain = ? AND user_id = ?',
+                    (self._cache_domain(), str(user_id))
+                ).fetchone()
+            except sqlite3.Error as e:
+                self.logger.warning(f"Error reading last login disk cache: {str(e)}")
+                return False, None
+        
+        if row and time.time() - row[1] < self.LAST_LOGIN_DISK_CACHE_TTL:
+            return True, row[0]
+        return False, None
+    
+    def _write_disk_last_login(self, user_id, last_login):
+        """
+        Store a last login in the on-disk cache.
+        
+        Args:
+            user_id: User ID
+            last_login: Last login date string or None
+        """
+        connection = self._get_disk_cache()
+        if not connection:
+            return
+        
+        with self._disk_cache_lock:
+            try:
+                with connection:
+                    connection.execute(
+                        'INSERT OR REPLACE INTO last_login_cache (domain, user_id, last_login, fetched_at) '
+                        'VALUES (?, ?, ?, ?)',
+                        (self._cache_domain(), str(user_id), last_login, time.time())
+                    )
+            except sqlite3.Error as e:
+                self.logger.warning(f"Error writing last login disk cache: {str(e)}")
     
     def get_user_ticket_activity(self, user_id=None, email=None, start_date=None, end_date=None, limit=50) -> List[Dict]:
         """
@@ -76,13 +531,42 @@ class ReportsManager:
                 workspace_id=None  # Don't use workspace prefix for tickets endpoint
             )
             
-            if isinstance(result, dict) and 'tickets' in result:
-                tickets = result.get('tickets', [])
-                self.logger.info(f"Found {len(tickets)} tickets for user")
-                return tickets
-            else:
+            if not isinstance(result, dict) or 'tickets' not in result:
                 self.logger.error(f"Unexpected API response format: {result}")
                 return []
+            
+            tickets = result.get('tickets', [])
+            
+            # Fetch any remaining pages concurrently when the first page was full
+            per_page = params['per_page']
+            pages = (limit + per_page - 1) // per_page
+            if pages > 1 and len(tickets) == per_page:
+                def fetch_page(page):
+                    try:
+                        return self.api_client._make_request(
+                            'GET',
+                            'tickets',
+                            params={**params, 'page': page},
+                            workspace_id=None
+                        )
+                    except Exception as e:
+                        self.logger.error(f"Error getting tickets page {page}: {str(e)}")
+                        return None
+                
+                with ThreadPoolExecutor(max_workers=min(pages - 1, 5)) as executor:
+                    page_results = list(executor.map(fetch_page, range(2, pages + 1)))
+                
+                # Concatenate in page order, stopping at the first short page
+                for page_result in page_results:
+                    batch = page_result.get('tickets', []) if isinstance(page_result, dict) else []
+                    tickets.extend(batch)
+                    if len(batch) < per_page:
+                        break
+                
+                tickets = tickets[:limit]
+            
+            self.logger.info(f"Found {len(tickets)} tickets for user")
+            return tickets
                 
         except Exception as e:
             self.logger.error(f"Error getting tickets: {str(e)}")
@@ -98,6 +582,12 @@ class ReportsManager:
         Returns:
             List of conversation data
         """
+        cache_key = (self.workspace_id, ticket_id)
+        entry = self._cache_get(self._conv_cache, cache_key, self.CONVERSATION_CACHE_TTL)
+        if entry:
+            self.logger.debug(f"Using cached conversations for ticket {ticket_id}")
+            return entry[1]
+        
         self.logger.info(f"Getting conversations for ticket {ticket_id}")
         
         try:
@@ -112,6 +602,10 @@ class ReportsManager:
                 ticket = result.get('ticket', {})
                 conversations = ticket.get('conversations', [])
                 self.logger.info(f"Found {len(conversations)} conversations for ticket {ticket_id}")
+                self._cache_put(
+                    self._conv_cache, cache_key, conversations,
+                    self.CONVERSATION_CACHE_TTL, self.CONVERSATION_CACHE_SIZE
+                )
                 return conversations
             else:
                 self.logger.error(f"Unexpected API response format: {result}")
@@ -121,6 +615,37 @@ class ReportsManager:
             self.logger.error(f"Error getting ticket conversations: {str(e)}")
             return []
     
+    def _get_conversations_for_tickets(self, ticket_ids) -> Dict[Any, List[Dict]]:
+        """
+        Fetch conversations for several tickets concurrently.
+        
+        Args:
+            ticket_ids: Iterable of ticket IDs
+            
+        Returns:
+            Dictionary mapping ticket ID to its list of conversations
+        """
+        ticket_ids = list(ticket_ids)
+        conversations_by_ticket = {}
+        if not ticket_ids:
+            return conversations_by_ticket
+        
+        workers = min(self.CONVERSATION_FETCH_WORKERS, len(ticket_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.get_ticket_conversations, ticket_id): ticket_id
+                for ticket_id in ticket_ids
+            }
+            for future in as_completed(futures):
+                ticket_id = futures[future]
+                try:
+                    conversations_by_ticket[ticket_id] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error fetching conversations for ticket {ticket_id}: {str(e)}")
+                    conversations_by_ticket[ticket_id] = []
+        
+        return conversations_by_ticket
+    
     def get_user_activity_report(self, user_id=None, email=None, days=30) -> Tuple[List[Dict], Dict]:
         """
         Generate a comprehensive user activity report.
@@ -146,53 +671,71 @@ class ReportsManager:
             limit=100
         )
         
-        activity_items = []
+        # Fetch conversations for all tickets concurrently
+        conversations_by_ticket = self._get_conversations_for_tickets(
+            ticket.get('id') for ticket in tickets
+        )
+        total_conversations = sum(
+            len(conversations_by_ticket.get(ticket.get('id'), [])) for ticket in tickets
+        )
         
-        # Process each ticket
-        for ticket in tickets:
-            ticket_id = ticket.get('id')
-            
-            # Basic ticket information
-            activity_item = {
-                'ticket_id': ticket_id,
-                'subject': ticket.get('subject', 'No subject'),
-                'status': ticket.get('status', 'Unknown'),
-                'priority': ticket.get('priority', 'Unknown'),
-                'created_at': ticket.get('created_at'),
-                'updated_at': ticket.get('updated_at'),
-                'type': 'ticket'
-            }
-            activity_items.append(activity_item)
-            
-            # Get conversations if available
-            try:
-                conversations = self.get_ticket_conversations(ticket_id)
-                
-                # Add each conversation as an activity item
-                for conv in conversations:
-                    activity_items.append({
-                        'ticket_id': ticket_id,
-                        'conversation_id': conv.get('id'),
-                        'body': conv.get('body', 'No content'),
-                        'created_at': conv.get('created_at'),
-                        'updated_at': conv.get('updated_at'),
-                        'user_id': conv.get('user_id'),
-                        'type': 'conversation'
-                    })
-            except Exception as e:
-                self.logger.error(f"Error processing conversations for ticket {ticket_id}: {str(e)}")
+        activity_items = list(self._iter_user_activity_items(tickets, conversations_by_ticket))
         
         # Sort by date (newest first)
-        activity_items.sort(key=lambda x: x.get('created_at', ''), reverse=True)
+        activity_items.sort(key=_ACTIVITY_SORT_KEY, reverse=True)
         
         # Generate summary
         summary = {
             'total_tickets': len(tickets),
             'date_range': f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}",
-            'total_conversations': len([i for i in activity_items if i.get('type') == 'conversation']),
+            'total_conversations': total_conversations,
         }
         
         return activity_items, summary
+    
+    def _iter_user_activity_items(self, tickets, conversations_by_ticket):
+        """
+        Yield activity items for a user's tickets in ticket order.
+        
+        Args:
+            tickets: List of ticket dictionaries
+            conversations_by_ticket: Dictionary mapping ticket ID to its conversations
+            
+        Yields:
+            ActivityItem for each ticket, followed by one per conversation
+        """
+        for ticket in tickets:
+            ticket_id, subject, status, priority, created_at, updated_at = _extract_ticket_fields(ticket)
+            
+            # Basic ticket information
+            yield ActivityItem(
+                ticket_id=ticket_id,
+                subject=subject,
+                status=status,
+                priority=priority,
+                created_at=created_at,
+                updated_at=updated_at,
+                type='ticket',
+                _ts=_iso_to_epoch(created_at)
+            )
+            
+            # Add each conversation as an activity item
+            for conv in conversations_by_ticket.get(ticket_id, []):
+                try:
+                    conv_get = conv.get
+                    conv_created_at = conv_get('created_at')
+                    yield ActivityItem(
+                        ticket_id=ticket_id,
+                        conversation_id=conv_get('id'),
+                        body=conv_get('body', 'No content'),
+                        created_at=conv_created_at,
+                        updated_at=conv_get('updated_at'),
+                        user_id=conv_get('user_id'),
+                        type='conversation',
+                        _ts=_iso_to_epoch(conv_created_at)
+                    )
+                except Exception as e:
+                    self.logger.error(f"Error processing conversations for ticket {ticket_id}: {str(e)}")
         
     def get_activity_visualization(self, activity_items, use_simple_chars=False):
         """
@@ -209,25 +752,14 @@ class ReportsManager:
             return ["No data available for visualization"]
             
         # Extract dates and group by day of week
-        day_counts = {0: 0, 1: 0, 2: 0, 3: 0, 4: 0, 5: 0, 6: 0}  # Monday to Sunday
-        day_names = {
-            0: "Monday   ",
-            1: "Tuesday  ",
-            2: "Wednesday",
-            3: "Thursday ",
-            4: "Friday   ",
-            5: "Saturday ",
-            6: "Sunday   "
-        }
+        day_counts = [0] * 7  # Monday to Sunday
         
         for item in activity_items:
             date_str = item.get('created_at', '')
             if date_str:
                 try:
-                    date_obj = datetime.datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%SZ")
-                    # Get day of week (0 = Monday, 6 = Sunday)
-                    day_of_week = date_obj.weekday()
-                    day_counts[day_of_week] += 1
+                    # Day of week (0 = Monday, 6 = Sunday)
+                    day_counts[_parse_iso_datetime(date_str).weekday()] += 1
                 except Exception:
                     continue
         
@@ -235,7 +767,7 @@ class ReportsManager:
         result = ["", "Activity Distribution by Day of Week:", ""]
         
         # Find max for scaling
-        max_count = max(day_counts.values()) if day_counts.values() else 0
+        max_count = max(day_counts)
         scale_factor = 40 / max_count if max_count > 0 else 0
         
         # Generate bars - use simpler chars for CSV export
@@ -245,10 +777,10 @@ class ReportsManager:
             
             # For CSV export, just show the count in parentheses
             if use_simple_chars:
-                result.append(f"{day_names[day]}: ({count})")
+                result.append(f"{_DAY_NAMES[day]}: ({count})")
             else:
                 bar = "█" * bar_length
-                result.append(f"{day_names[day]}: {bar} ({count})")
+                result.append(f"{_DAY_NAMES[day]}: {bar} ({count})")
         
         return result
         
@@ -265,98 +797,32 @@ class ReportsManager:
             True if successful, False otherwise
         """
         try:
-            # Status and priority mapping for human-readable values
-            status_map = {
-                1: "Open",
-                2: "Pending",
-                3: "Resolved",
-                4: "Closed", 
-                5: "New",
-                6: "In Progress",
-                7: "On Hold"
-            }
-            
-            priority_map = {
-                1: "Low",
-                2: "Medium",
-                3: "High",
-                4: "Urgent"
-            }
-            
-            # Prepare data for CSV
-            csv_data = []
-            
-            # Add summary as header rows
-            csv_data.append(['User Activity Report'])
-            csv_data.append(['Date Range', summary.get('date_range')])
-            csv_data.append(['Total Tickets', str(summary.get('total_tickets', 0))])
-            csv_data.append(['Total Conversations', str(summary.get('total_conversations', 0))])
-            csv_data.append([])  # Empty row
-            
-            # Add visualization with simple chars for CSV
-            visualization = self.get_activity_visualization(activity_items, use_simple_chars=True)
-            for line in visualization:
-                csv_data.append([line])
-            
-            csv_data.append([])  # Empty row
-            
-            # Add column headers - improved headers
-            headers = [
-                'Date', 
-                'Type', 
-                'Ticket ID', 
-                'Subject/Content', 
-                'Status',
-                'Priority',
-                'Last Updated'
-            ]
-            csv_data.append(headers)
-            
-            # Add data rows
-            for item in activity_items:
-                # Format the date
-                created_date = self._format_date(item.get('created_at', ''))
-                updated_date = self._format_date(item.get('updated_at', ''))
-                
-                if item.get('type') == 'ticket':
-                    # Convert numeric status and priority to readable text
-                    status_val = item.get('status')
-                    status_text = status_map.get(status_val, f"Status {status_val}")
-                    
-                    priority_val = item.get('priority')
-                    priority_text = priority_map.get(priority_val, f"Priority {priority_val}")
-                    
-                    csv_data.append([
-                        created_date,
-                        'Ticket',
-                        str(item.get('ticket_id', '')),
-                        item.get('subject', ''),
-                        status_text,
-                        priority_text,
-                        updated_date
-                    ])
-                elif item.get('type') == 'conversation':
-                    # Clean the HTML content
-                    body = self._clean_html(item.get('body', ''))
-                    
-                    # Truncate long content
-                    if len(body) > 100:
-                        body = body[:97] + '...'
-                        
-                    csv_data.append([
-                        created_date,
-                        'Response',
-                        str(item.get('ticket_id', '')),
-                        body,
-                        '', # No status for conversations
-                        '',  # No priority for conversations
-                        updated_date
-                    ])
-            
-            # Write to CSV
+            # Write to CSV as rows are built
             with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
                 writer = csv.writer(csvfile)
-                writer.writerows(csv_data)
+                
+                # Add summary as header rows
+                writer.writerow(['User Activity Report'])
+                writer.writerow(['Date Range', summary.get('date_range')])
+                writer.writerow(['Total Tickets', str(summary.get('total_tickets', 0))])
+                writer.writerow(['Total Conversations', str(summary.get('total_conversations', 0))])
+                writer.writerow([])  # Empty row
+                
+                # Add visualization with simple chars for CSV
+                visualization = self.get_activity_visualization(activity_items, use_simple_chars=True)
+                for line in visualization:
+                    writer.writerow([line])
+                
+                writer.writerow([])  # Empty row
+                
+                # Add column headers - improved headers
+                writer.writerow(_ACTIVITY_CSV_HEADERS)
+                
+                # Add data rows
+                for item in activity_items:
+                    row = self._activity_csv_row(item)
+                    if row is not None:
+                        writer.writerow(row)
                 
             return True
             
@@ -364,6 +830,61 @@ class ReportsManager:
             self.logger.error(f"Error exporting activity report to CSV: {str(e)}")
             return False
     
+    def _activity_csv_row(self, item):
+        """
+        Format an activity item as a row of the activity report CSV.
+        
+        Args:
+            item: Activity item
+            
+        Returns:
+            List of column values, or None if the item type is not exported
+        """
+        # Format the date
+        created_date = self._format_date(item.get('created_at', ''))
+        updated_date = self._format_date(item.get('updated_at', ''))
+        
+        item_type = item.get('type')
+        if item_type == 'ticket':
+            # Convert numeric status and priority to readable text
+            status_val = item.get('status')
+            status_text = _STATUS_MAP.get(status_val, f"Status {status_val}")
+            
+            priority_val = item.get('priority')
+            priority_text = _PRIORITY_MAP.get(priority_val, f"Priority {priority_val}")
+            
+            return [
+                created_date,
+                'Ticket',
+                str(item.get('ticket_id', '')),
+                item.get('subject', ''),
+                status_text,
+                priority_text,
+                updated_date
+            ]
+        
+        if item_type == 'conversation':
+            # Clean the HTML content. Only ~100 visible characters are kept, so
+            # don't spend time cleaning the rest of very long bodies
+            raw_body = item.get('body', '') or ''
+            body = self._clean_html(raw_body[:_MAX_RAW_BODY_LENGTH])
+            
+            # Truncate long content
+            if len(body) > 100:
+                body = body[:97] + '...'
+                
+            return [
+                created_date,
+                'Response',
+                str(item.get('ticket_id', '')),
+                body,
+                '',  # No status for conversations
+                '',  # No priority for conversations
+                updated_date
+            ]
+        
+        return None
+    
     def _clean_html(self, html_content):
         """
         Remove HTML tags from content and clean up formatting.
@@ -378,38 +899,19 @@ class ReportsManager:
             return ""
             
         try:
-            import re
-            
-            # Replace common HTML entities
-            replacements = {
-                '&nbsp;': ' ',
-                '&amp;': '&',
-                '&lt;': '<',
-                '&gt;': '>',
-                '&quot;': '"',
-                '&apos;': "'",
-                '&#39;': "'",
-                '&ndash;': '-',
-                '&mdash;': '--',
-                '<br>': ' ',
-                '<br/>': ' ',
-                '<br />': ' ',
-                '</div>': ' ',
-                '</p>': ' '
-            }
-            
-            # Apply replacements
-            for old, new in replacements.items():
-                html_content = html_content.replace(old, new)
+            # Replace common HTML entities in a single pass
+            html_content = _ENTITY_RE.sub(
+                lambda m: _HTML_ENTITIES.get(m.group(0).lower(), ' '), html_content
+            )
             
             # First handle line breaks to preserve some formatting
-            html_content = re.sub(r'<(div|p)[^>]*>', ' ', html_content, flags=re.IGNORECASE)
+            html_content = _BLOCK_TAG_RE.sub(' ', html_content)
             
             # Remove all remaining HTML tags
-            clean_text = re.sub(r'<[^>]+>', ' ', html_content)
+            clean_text = _HTML_TAG_RE.sub(' ', html_content)
             
             # Fix excess whitespace
-            clean_text = re.sub(r'\s+', ' ', clean_text)
+            clean_text = _WHITESPACE_RE.sub(' ', clean_text)
             
             # Remove leading/trailing whitespace
             clean_text = clean_text.strip()
@@ -435,7 +937,7 @@ class ReportsManager:
             
         try:
             # Parse ISO format
-            date_obj = datetime.datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%SZ")
+            date_obj = _parse_iso_datetime(date_str)
             # Return formatted date
             return date_obj.strftime("%Y-%m-%d %H:%M")
         except Exception:
@@ -483,37 +985,120 @@ class ReportsManager:
         Returns:
             List of tickets the agent has interacted with
         """
-        self.logger.info(f"Getting ticket interactions for agent_id={agent_id}")
+        tickets, _ = self._collect_agent_ticket_interactions(agent_id, start_date, limit)
+        return tickets
+    
+    def _collect_agent_ticket_interactions(self, agent_id, start_date=None, limit=100):
+        """
+        Find the tickets an agent interacted with, plus any conversations fetched along the way.
         
-        # We will combine results from different queries
-        all_agent_tickets = []
+        Args:
+            agent_id: Agent ID to check
+            start_date: Start date for ticket activity (ISO format)
+            limit: Maximum number of tickets to return
+            
+        Returns:
+            Tuple of (tickets, conversations by ticket ID for the tickets whose
+            conversations the scan already fetched)
+        """
+        self.logger.info(f"Getting ticket interactions for agent_id={agent_id}")
         
-        # Try multiple approaches to find agent tickets, with fallbacks
-        approaches = [
+        # Single-request approaches run concurrently; scanning is the expensive fallback
+        quick_approaches = [
+            self._get_agent_tickets_by_query,
             self._get_agent_tickets_by_responder_id,
-            self._get_agent_tickets_by_filter,
-            self._get_agent_tickets_by_scanning
+            self._get_agent_tickets_by_filter
         ]
         
-        for approach_index, approach_method in enumerate(approaches):
-            if all_agent_tickets:
-                self.logger.info(f"Already found {len(all_agent_tickets)} tickets, skipping additional approaches")
-                break
-                
+        def run_approach(approach_index, approach_method):
             try:
                 self.logger.info(f"Trying approach #{approach_index+1} to find agent tickets")
-                tickets = approach_method(agent_id, start_date, limit)
+                tickets = approach_method(agent_id, start_date, limit) or []
                 if tickets:
-                    all_agent_tickets.extend(tickets)
                     self.logger.info(f"Found {len(tickets)} tickets using approach #{approach_index+1}")
+                return tickets
             except Exception as e:
                 self.logger.error(f"Error with approach #{approach_index+1}: {str(e)}")
-                # Continue to next approach
+                return []
+        
+        with ThreadPoolExecutor(max_workers=len(quick_approaches)) as executor:
+            futures = [
+                executor.submit(run_approach, approach_index, approach_method)
+                for approach_index, approach_method in enumerate(quick_approaches)
+            ]
+            results = [future.result() for future in futures]
+        
+        # Combine results in approach order, keeping the first copy of each ticket
+        seen_ticket_ids = set()
+        all_agent_tickets = []
+        for tickets in results:
+            for ticket in tickets:
+                ticket_id = ticket.get('id')
+                if ticket_id not in seen_ticket_ids:
+                    seen_ticket_ids.add(ticket_id)
+                    all_agent_tickets.append(ticket)
+        
+        # Each approach honours limit on its own, so the merge can overshoot it; keep the newest
+        all_agent_tickets.sort(key=lambda ticket: ticket.get('updated_at') or '', reverse=True)
+        all_agent_tickets = all_agent_tickets[:limit]
+        
+        conversations_by_ticket = {}
+        if all_agent_tickets:
+            self.logger.info(f"Already found {len(all_agent_tickets)} tickets, skipping ticket scanning")
+        else:
+            all_agent_tickets = run_approach(
+                len(quick_approaches),
+                lambda *args: self._get_agent_tickets_by_scanning(*args, conversations_out=conversations_by_ticket)
+            )
         
-        return all_agent_tickets
+        return all_agent_tickets, conversations_by_ticket
+    
+    def _get_agent_tickets_by_query(self, agent_id, start_date=None, limit=100):
+        """Approach 1: Ask the filter endpoint for tickets assigned to the agent"""
+        self.logger.info(f"Querying tickets filtered by agent {agent_id}")
+        
+        query = f"agent_id:{agent_id}"
+        if start_date:
+            # The filter query language only accepts dates (YYYY-MM-DD)
+            query += f" AND updated_at:>'{start_date[:10]}'"
+        
+        params = {'query': f'"{query}"'}
+        if self.workspace_id:
+            params['workspace_id'] = self.workspace_id
+        
+        agent_tickets = []
+        page = 1
+        max_pages = 10  # The filter endpoint serves at most 10 pages of 30 tickets
+        
+        while len(agent_tickets) < limit and page <= max_pages:
+            params['page'] = page
+            result = self.api_client._make_request(
+                'GET',
+                'tickets/filter',
+                params=params,
+                workspace_id=None
+            )
+            
+            if not isinstance(result, dict) or 'tickets' not in result:
+                break
+            
+            batch = result.get('tickets', [])
+            if not batch:
+                break
+            
+            agent_tickets.extend(batch)
+            
+            # Stop once every matching ticket has been collected
+            if len(agent_tickets) >= result.get('total', 0):
+                break
+            
+            page += 1
+        
+        self.logger.info(f"Found {len(agent_tickets)} tickets for agent {agent_id} through the filter query")
+        return agent_tickets[:limit]
     
     def _get_agent_tickets_by_responder_id(self, agent_id, start_date=None, limit=100):
-        """Approach 1: Try to get tickets based on agent assignment using supported methods"""
+        """Approach 2: Try to get tickets based on agent assignment using supported methods"""
         self.logger.info(f"Searching for tickets assigned to agent {agent_id} using supported parameters")
         
         # For this method, we won't use responder_id directly since it's not supported
@@ -544,16 +1129,16 @@ class ReportsManager:
         tickets = result.get('tickets', [])
         self.logger.info(f"Filtering {len(tickets)} tickets for agent {agent_id} assignment")
         
+        agent_id_str = str(agent_id)
         for ticket in tickets:
-            responder_id = ticket.get('responder_id')
-            if responder_id and str(responder_id) == str(agent_id):
+            if _is_same_id(ticket.get('responder_id'), agent_id, agent_id_str):
                 agent_tickets.append(ticket)
         
         self.logger.info(f"Found {len(agent_tickets)} tickets assigned to agent {agent_id}")
         return agent_tickets
     
     def _get_agent_tickets_by_filter(self, agent_id, start_date=None, limit=100):
-        """Approach 2: Try using standard filter parameters"""
+        """Approach 3: Try using standard filter parameters"""
         self.logger.info(f"Searching for tickets with agent {agent_id} using standard filters")
         
         # Try using the watching filter which might show tickets the agent is involved with
@@ -582,9 +1167,10 @@ class ReportsManager:
         
         # Still need to filter locally to verify this agent is involved
         agent_tickets = []
+        agent_id_str = str(agent_id)
         for ticket in tickets:
             # Check if agent is the responder
-            if ticket.get('responder_id') and str(ticket.get('responder_id')) == str(agent_id):
+            if _is_same_id(ticket.get('responder_id'), agent_id, agent_id_str):
                 agent_tickets.append(ticket)
                 continue
             
@@ -593,8 +1179,12 @@ class ReportsManager:
         self.logger.info(f"Found {len(agent_tickets)} tickets with agent {agent_id} through standard filters")
         return agent_tickets
     
-    def _get_agent_tickets_by_scanning(self, agent_id, start_date=None, limit=100):
-        """Approach 3: Get all recent tickets and filter locally"""
+    def _get_agent_tickets_by_scanning(self, agent_id, start_date=None, limit=100, conversations_out=None):
+        """Approach 4: Get all recent tickets and filter locally.
+        
+        Conversations fetched for matched tickets are stored by ticket ID in
+        conversations_out, when given, so callers don't fetch them again.
+        """
         self.logger.info(f"Scanning recent tickets for agent {agent_id}")
         
         # Get a sample of recent tickets without filtering
@@ -633,24 +1223,45 @@ class ReportsManager:
             conversation_errors = 0
             max_conversation_errors = 3  # Only log first few errors
             
-            for ticket in recent_tickets:
-                responder_id = ticket.get('responder_id')
-                if responder_id and str(responder_id) == str(agent_id):
-                    agent_tickets.append(ticket)
-                    continue
-                    
-                # If we didn't find the agent as responder, check conversations
-                try:
-                    ticket_id = ticket.get('id')
-                    conversations = self.get_ticket_conversations(ticket_id)
-                    if any(conv.get('user_id') == agent_id for conv in conversations):
+            agent_id_str = str(agent_id)
+            
+            def is_responder(ticket):
+                return _is_same_id(ticket.get('responder_id'), agent_id, agent_id_str)
+            
+            # Scan in windows so conversation fetches stop once `limit` matches are found
+            window_size = self.CONVERSATION_FETCH_WORKERS
+            for window_start in range(0, len(recent_tickets), window_size):
+                if len(agent_tickets) >= limit:
+                    break
+                
+                window = recent_tickets[window_start:window_start + window_size]
+                
+                # Fetch conversations concurrently for tickets where the agent isn't the responder
+                conversations_by_ticket = self._get_conversations_for_tickets(
+                    ticket.get('id') for ticket in window if not is_responder(ticket)
+                )
+                
+                for ticket in window:
+                    if is_responder(ticket):
                         agent_tickets.append(ticket)
-                except Exception as e:
-                    conversation_errors += 1
-                    if conversation_errors <= max_conversation_errors:
-                        self.logger.error(f"Error checking conversations for ticket {ticket.get('id')}: {str(e)}")
-                    elif conversation_errors == max_conversation_errors + 1:
-                        self.logger.error(f"Additional conversation errors suppressed to avoid log spam")
+                    else:
+                        # If we didn't find the agent as responder, check conversations
+                        try:
+                            conversations = conversations_by_ticket.get(ticket.get('id'), [])
+                            if any(_is_same_id(conv.get('user_id'), agent_id, agent_id_str) for conv in conversations):
+                                # Keep the conversations so the activity report doesn't fetch them again
+                                if conversations_out is not None:
+                                    conversations_out[ticket.get('id')] = conversations
+                                agent_tickets.append(ticket)
+                        except Exception as e:
+                            conversation_errors += 1
+                            if conversation_errors <= max_conversation_errors:
+                                self.logger.error(f"Error checking conversations for ticket {ticket.get('id')}: {str(e)}")
+                            elif conversation_errors == max_conversation_errors + 1:
+                                self.logger.error(f"Additional conversation errors suppressed to avoid log spam")
+                    
+                    if len(agent_tickets) >= limit:
+                        break
             
             self.logger.info(f"Found {len(agent_tickets)} tickets with agent involvement through scanning")
             return agent_tickets
@@ -679,63 +1290,84 @@ class ReportsManager:
         start_date_str = start_date.strftime("%Y-%m-%dT00:00:00Z")
         
         # Get tickets the agent has interacted with
-        agent_tickets = self.get_agent_ticket_interactions(
+        agent_tickets, conversations_by_ticket = self._collect_agent_ticket_interactions(
             agent_id=agent_id,
             start_date=start_date_str,
             limit=100
         )
         
         activity_items = []
+        total_responses = 0
+        assigned_tickets = 0
+        collaborated_tickets = 0
+        
+        # Fetch conversations concurrently, skipping tickets whose conversations scanning already fetched
+        conversations_by_ticket.update(self._get_conversations_for_tickets(
+            ticket.get('id') for ticket in agent_tickets
+            if ticket.get('id') not in conversations_by_ticket
+        ))
+        
+        # Match IDs the same way the ticket search did, so string IDs count too
+        agent_id_str = str(agent_id)
         
         # Process each ticket
         for ticket in agent_tickets:
-            ticket_id = ticket.get('id')
+            ticket_id, subject, status, priority, created_at, updated_at = _extract_ticket_fields(ticket)
             
             # Add ticket as an activity item with agent role
-            activity_item = {
-                'ticket_id': ticket_id,
-                'subject': ticket.get('subject', 'No subject'),
-                'status': ticket.get('status', 'Unknown'),
-                'priority': ticket.get('priority', 'Unknown'),
-                'created_at': ticket.get('created_at'),
-                'updated_at': ticket.get('updated_at'),
-                'type': 'ticket',
-                'role': 'agent',
-                'agent_role': 'Assigned' if ticket.get('responder_id') == agent_id else 'Collaborator'
-            }
+            is_assigned = _is_same_id(ticket.get('responder_id'), agent_id, agent_id_str)
+            if is_assigned:
+                assigned_tickets += 1
+            else:
+                collaborated_tickets += 1
+            
+            activity_item = ActivityItem(
+                ticket_id=ticket_id,
+                subject=subject,
+                status=status,
+                priority=priority,
+                created_at=created_at,
+                updated_at=updated_at,
+                type='ticket',
+                _ts=_iso_to_epoch(created_at),
+                role='agent',
+                agent_role='Assigned' if is_assigned else 'Collaborator'
+            )
             activity_items.append(activity_item)
             
             # Get conversations to find agent responses
             try:
-                conversations = self.get_ticket_conversations(ticket_id)
+                conversations = conversations_by_ticket.get(ticket_id, [])
                 
                 # Add each agent response as an activity item
                 for conv in conversations:
-                    if conv.get('user_id') == agent_id:
-                        activity_items.append({
-                            'ticket_id': ticket_id,
-                            'conversation_id': conv.get('id'),
-                            'body': conv.get('body', 'No content'),
-                            'created_at': conv.get('created_at'),
-                            'updated_at': conv.get('updated_at'),
-                            'user_id': conv.get('user_id'),
-                            'type': 'conversation',
-                            'role': 'agent',
-                            'conversation_type': conv.get('private', False) and 'Private Note' or 'Public Reply'
-                        })
+                    if _is_same_id(conv.get('user_id'), agent_id, agent_id_str):
+                        activity_items.append(ActivityItem(
+                            ticket_id=ticket_id,
+                            conversation_id=conv.get('id'),
+                            body=conv.get('body', 'No content'),
+                            created_at=conv.get('created_at'),
+                            updated_at=conv.get('updated_at'),
+                            user_id=conv.get('user_id'),
+                            type='conversation',
+                            _ts=_iso_to_epoch(conv.get('created_at')),
+                            role='agent',
+                            conversation_type=conv.get('private', False) and 'Private Note' or 'Public Reply'
+                        ))
+                        total_responses += 1
             except Exception as e:
                 self.logger.error(f"Error processing agent conversations for ticket {ticket_id}: {str(e)}")
         
         # Sort by date (newest first)
-        activity_items.sort(key=lambda x: x.get('created_at', ''), reverse=True)
+        activity_items.sort(key=_ACTIVITY_SORT_KEY, reverse=True)
         
         # Generate summary
         summary = {
             'total_tickets': len(agent_tickets),
             'date_range': f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}",
-            'total_responses': len([i for i in activity_items if i.get('type') == 'conversation']),
-            'assigned_tickets': len([i for i in activity_items if i.get('type') == 'ticket' and i.get('agent_role') == 'Assigned']),
-            'collaborated_tickets': len([i for i in activity_items if i.get('type') == 'ticket' and i.get('agent_role') == 'Collaborator'])
+            'total_responses': total_responses,
+            'assigned_tickets': assigned_tickets,
+            'collaborated_tickets': collaborated_tickets
         }
         
         return activity_items, summary
@@ -801,27 +1433,33 @@ class ReportsManager:
                 self.logger.error(f"Error checking if user is agent: {error_type}: {str(e)}")
                 # Continue with just requester activity
         
-        # Combine activities
-        all_items = requester_items.copy()
-        
         # Add agent items avoiding duplicates (same ticket might appear in both lists)
-        ticket_ids_seen = set(item.get('ticket_id') for item in all_items if item.get('type') == 'ticket')
-        conversation_ids_seen = set(item.get('conversation_id') for item in all_items if item.get('type') == 'conversation' and 'conversation_id' in item)
-        
+        ticket_ids_seen = set()
+        conversation_ids_seen = set()
+        for item in requester_items:
+            item_type = item.get('type')
+            if item_type == 'ticket':
+                ticket_ids_seen.add(item.get('ticket_id'))
+            elif item_type == 'conversation' and 'conversation_id' in item:
+                conversation_ids_seen.add(item.get('conversation_id'))
+        
+        new_agent_items = []
+        add_new_item = new_agent_items.append
         for item in agent_items:
-            if item.get('type') == 'ticket':
+            item_type = item.get('type')
+            if item_type == 'ticket':
                 ticket_id = item.get('ticket_id')
                 if ticket_id not in ticket_ids_seen:
-                    all_items.append(item)
+                    add_new_item(item)
                     ticket_ids_seen.add(ticket_id)
-            elif item.get('type') == 'conversation':
+            elif item_type == 'conversation':
                 conversation_id = item.get('conversation_id')
                 if conversation_id not in conversation_ids_seen:
-                    all_items.append(item)
+                    add_new_item(item)
                     conversation_ids_seen.add(conversation_id)
         
-        # Sort combined list by date
-        all_items.sort(key=lambda x: x.get('created_at', ''), reverse=True)
+        # Both reports are already sorted newest first, so merge rather than re-sort
+        all_items = list(heapq.merge(requester_items, new_agent_items, key=_ACTIVITY_SORT_KEY, reverse=True))
         
         # Create combined summary
         combined_summary = {
@@ -859,122 +1497,113 @@ class ReportsManager:
             True if successful, False otherwise
         """
         try:
-            # Status and priority mapping for human-readable values
-            status_map = {
-                1: "Open",
-                2: "Pending",
-                3: "Resolved",
-                4: "Closed", 
-                5: "New",
-                6: "In Progress",
-                7: "On Hold"
-            }
-            
-            priority_map = {
-                1: "Low",
-                2: "Medium",
-                3: "High",
-                4: "Urgent"
-            }
-            
-            # Prepare data for CSV
-            csv_data = []
-            
-            # Add summary as header rows
-            csv_data.append(['User Activity Report'])
-            csv_data.append(['Date Range', summary.get('date_range', '')])
-            csv_data.append(['Is Agent', 'Yes' if summary.get('is_agent', False) else 'No'])
-            csv_data.append(['Total Tickets Created', str(summary.get('total_tickets_created', 0))])
-            
-            # Include agent summary if applicable
-            if summary.get('is_agent', False):
-                csv_data.append(['Total Tickets Worked On', str(summary.get('total_tickets_worked', 0))])
-                csv_data.append(['Tickets Assigned', str(summary.get('tickets_assigned', 0))])
-                csv_data.append(['Tickets Collaborated On', str(summary.get('tickets_collaborated', 0))])
-                csv_data.append(['Total Responses as Agent', str(summary.get('total_responses_as_agent', 0))])
-            
-            csv_data.append(['Total Conversations as Requester', str(summary.get('total_conversations_as_requester', 0))])
-            csv_data.append([])  # Empty row
-            
-            # Add visualization with simple chars for CSV
-            visualization = self.get_activity_visualization(activity_items, use_simple_chars=True)
-            for line in visualization:
-                csv_data.append([line])
-            
-            csv_data.append([])  # Empty row
-            
-            # Add column headers - improved headers with role
-            headers = [
-                'Date', 
-                'Type', 
-                'Role',
-                'Ticket ID', 
-                'Subject/Content', 
-                'Status',
-                'Priority',
-                'Last Updated',
-                'Notes'
-            ]
-            csv_data.append(headers)
-            
-            # Add data rows
-            for item in activity_items:
-                # Format the date
-                created_date = self._format_date(item.get('created_at', ''))
-                updated_date = self._format_date(item.get('updated_at', ''))
-                role = item.get('role', 'requester')
+            # Local aliases for the shared status, priority and role labels used in the row loop
+            status_map = _STATUS_MAP
+            priority_map = _PRIORITY_MAP
+            role_labels = _ROLE_LABELS
+            
+            # Produce rows lazily so the report is never held in memory as a whole
+            def generate_rows():
+                # Add summary as header rows
+                yield ['User Activity Report']
+                yield ['Date Range', summary.get('date_range', '')]
+                yield ['Is Agent', 'Yes' if summary.get('is_agent', False) else 'No']
+                yield ['Total Tickets Created', str(summary.get('total_tickets_created', 0))]
                 
-                if item.get('type') == 'ticket':
-                    # Convert numeric status and priority to readable text
-                    status_val = item.get('status')
-                    status_text = status_map.get(status_val, f"Status {status_val}")
-                    
-                    priority_val = item.get('priority')
-                    priority_text = priority_map.get(priority_val, f"Priority {priority_val}")
-                    
-                    notes = ""
-                    if role == 'agent':
-                        notes = item.get('agent_role', '')
-                    
-                    csv_data.append([
-                        created_date,
-                        'Ticket',
-                        role.capitalize(),
-                        str(item.get('ticket_id', '')),
-                        item.get('subject', ''),
-                        status_text,
-                        priority_text,
-                        updated_date,
-                        notes
-                    ])
-                elif item.get('type') == 'conversation':
-                    # Clean the HTML content
-                    body = self._clean_html(item.get('body', ''))
-                    
-                    # Truncate long content
-                    if len(body) > 100:
-                        body = body[:97] + '...'
+                # Include agent summary if applicable
+                if summary.get('is_agent', False):
+                    yield ['Total Tickets Worked On', str(summary.get('total_tickets_worked', 0))]
+                    yield ['Tickets Assigned', str(summary.get('tickets_assigned', 0))]
+                    yield ['Tickets Collaborated On', str(summary.get('tickets_collaborated', 0))]
+                    yield ['Total Responses as Agent', str(summary.get('total_responses_as_agent', 0))]
+                
+                yield ['Total Conversations as Requester', str(summary.get('total_conversations_as_requester', 0))]
+                yield []  # Empty row
+                
+                # Add visualization with simple chars for CSV
+                visualization = self.get_activity_visualization(activity_items, use_simple_chars=True)
+                for line in visualization:
+                    yield [line]
+                
+                yield []  # Empty row
+                
+                # Add column headers - improved headers with role
+                headers = [
+                    'Date', 
+                    'Type', 
+                    'Role',
+                    'Ticket ID', 
+                    'Subject/Content', 
+                    'Status',
+                    'Priority',
+                    'Last Updated',
+                    'Notes'
+                ]
+                yield headers
+                
+                # Add data rows
+                for item in activity_items:
+                    # Format the date
+                    created_date = self._format_date(item.get('created_at', ''))
+                    updated_date = self._format_date(item.get('updated_at', ''))
+                    role = item.get('role', 'requester')
+                    role_label = role_labels.get(role) or role.capitalize()
+                    ticket_id_text = str(item.get('ticket_id', ''))
                     
-                    notes = ""
-                    if role == 'agent':
-                        notes = item.get('conversation_type', '')
+                    item_type = item.get('type')
+                    if item_type == 'ticket':
+                        # Convert numeric status and priority to readable text
+                        status_val = item.get('status')
+                        status_text = status_map.get(status_val, f"Status {status_val}")
                         
-                    csv_data.append([
-                        created_date,
-                        'Response',
-                        role.capitalize(),
-                        str(item.get('ticket_id', '')),
-                        body,
-                        '', # No status for conversations
-                        '',  # No priority for conversations
-                        updated_date,
-                        notes
-                    ])
-            
+                        priority_val = item.get('priority')
+                        priority_text = priority_map.get(priority_val, f"Priority {priority_val}")
+                        
+                        notes = ""
+                        if role == 'agent':
+                            notes = item.get('agent_role', '')
+                        
+                        yield [
+                            created_date,
+                            'Ticket',
+                            role_label,
+                            ticket_id_text,
+                            item.get('subject', ''),
+                            status_text,
+                            priority_text,
+                            updated_date,
+                            notes
+                        ]
+                    elif item_type == 'conversation':
+                        # Clean the HTML content. Only ~100 visible characters are kept, so
+                        # don't spend time cleaning the rest of very long bodies
+                        raw_body = item.get('body', '') or ''
+                        body = self._clean_html(raw_body[:_MAX_RAW_BODY_LENGTH])
+                        
+                        # Truncate long content
+                        if len(body) > 100:
+                            body = body[:97] + '...'
+                        
+                        notes = ""
+                        if role == 'agent':
+                            notes = item.get('conversation_type', '')
+                            
+                        yield [
+                            created_date,
+                            'Response',
+                            role_label,
+                            ticket_id_text,
+                            body,
+                            '', # No status for conversations
+                            '',  # No priority for conversations
+                            updated_date,
+                            notes
+                        ]
+                
             # Write to CSV
-            with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+            with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
                 writer = csv.writer(csvfile)
-                writer.writerows(csv_data)
+                writer.writerows(generate_rows())
                 
             return True
             
@@ -1000,29 +1629,29 @@ class ReportsManager:
         }
         
         try:
-            # Test basic tickets endpoint
-            self.logger.info("Testing basic tickets endpoint")
-            diagnostics['endpoints']['tickets'] = self._test_endpoint('tickets', {'per_page': 1})
-            
-            # Test agents endpoint
-            self.logger.info("Testing agents endpoint")
-            diagnostics['endpoints']['agents'] = self._test_endpoint('agents', {'per_page': 1})
-            
-            # Test tickets with supported parameters
-            self.logger.info("Testing tickets with standard filters")
-            diagnostics['endpoints']['tickets_standard_filter'] = self._test_endpoint(
-                'tickets', 
-                {'filter': 'watching', 'per_page': 1}  # This is a supported filter value
-            )
-            
-            # Test tickets with a specific requester_id (which is supported)
             # Use the current user's ID if available, otherwise try ID 1
             requester_id = current_user_id or 1
-            self.logger.info(f"Testing tickets with requester_id parameter using ID: {requester_id}")
-            diagnostics['endpoints']['tickets_requester'] = self._test_endpoint(
-                'tickets', 
-                {'requester_id': requester_id, 'per_page': 1}
-            )
+            
+            # These endpoint tests are independent of each other, so run them concurrently
+            independent_tests = {
+                # Basic tickets endpoint
+                'tickets': ('tickets', {'per_page': 1}),
+                # Agents endpoint
+                'agents': ('agents', {'per_page': 1}),
+                # Tickets with supported parameters
+                'tickets_standard_filter': ('tickets', {'filter': 'watching', 'per_page': 1}),  # This is a supported filter value
+                # Tickets with a specific requester_id (which is supported)
+                'tickets_requester': ('tickets', {'requester_id': requester_id, 'per_page': 1}),
+            }
+            self.logger.info(f"Testing endpoints: {', '.join(independent_tests)} (requester_id: {requester_id})")
+            
+            with ThreadPoolExecutor(max_workers=len(independent_tests)) as executor:
+                futures = {
+                    name: executor.submit(self._test_endpoint, endpoint, params)
+                    for name, (endpoint, params) in independent_tests.items()
+                }
+                for name, future in futures.items():
+                    diagnostics['endpoints'][name] = future.result()
             
             # Test ticket conversations
             self.logger.info("Testing ticket conversations endpoint")
@@ -1130,16 +1759,15 @@ class ReportsManager:
             # Try to extract status code if available
             try:
                 if 'status code' in error_str.lower():
-                    import re
-                    status_match = re.search(r'(\d{3})', error_str)
+                    status_match = _STATUS_CODE_RE.search(error_str)
                     if status_match:
-                        result['status_code'] = int(status_match.group(1))
+                        result['status_code'] = int(status_match.group(0))
             except:
                 pass
                 
             return result 
 
-    def get_inactive_users_report(self, threshold_days=90, include_agents=True, include_requesters=True, progress_callback=None, test_user_id=None):
+    def get_inactive_users_report(self, threshold_days=90, include_agents=True, include_requesters=True, progress_callback=None, test_user_id=None, top_k=None):
         """
         Generate a report of inactive users who haven't logged in within the specified period.
         
@@ -1149,18 +1777,36 @@ class ReportsManager:
             include_requesters: Whether to include requesters in the report
             progress_callback: Optional callback function to report progress
             test_user_id: Optional user ID to use for API capability testing
+            top_k: Optional limit; only the top_k longest-inactive users are returned
             
         Returns:
             Tuple of (inactive_users_list, summary)
         """
+        if not include_agents and not include_requesters:
+            self.logger.warning("Inactive users report requested with no user types selected")
+            return [], {
+                'total_inactive_users': 0,
+                'inactive_agents': 0,
+                'inactive_requesters': 0,
+                'agents_older_than_threshold': 0,
+                'requesters_older_than_threshold': 0,
+                'users_without_login_data': 0,
+                'threshold_days': threshold_days,
+                'execution_time_seconds': 0,
+                'report_generated_at': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                'using_alternative_methods': False,
+                'error': 'No user types selected'
+            }
+        
         self.logger.info(f"Generating inactive users report with threshold of {threshold_days} days")
         inactive_users = []
         start_time = datetime.datetime.now()
         
-        # Track statistics for the report
+        # Track statistics for the report. Only users created before the cutoff are
+        # fetched and checked, so the totals count those rather than everyone
         stats = {
-            'total_agents_checked': 0,
-            'total_requesters_checked': 0,
+            'agents_older_than_threshold': 0,
+            'requesters_older_than_threshold': 0,
             'inactive_agents': 0,
             'inactive_requesters': 0,
             'users_without_login_data': 0,
@@ -1168,7 +1814,7 @@ class ReportsManager:
         }
         
         # Calculate the cutoff date for inactivity
-        cutoff_date = datetime.datetime.now() - datetime.timedelta(days=threshold_days)
+        cutoff_date = start_time - datetime.timedelta(days=threshold_days)
         cutoff_date_str = cutoff_date.strftime("%Y-%m-%dT00:00:00Z")
         
         # Flag to track if we're using fallback methods
@@ -1180,8 +1826,7 @@ class ReportsManager:
                 if progress_callback:
                     progress_callback("Retrieving agent list...")
                     
-                agents = self._get_all_agents()
-                stats['total_agents_checked'] = len(agents)
+                agents = self._get_all_agents(created_before=cutoff_date)
                 self.logger.info(f"Checking {len(agents)} agents for inactivity")
                 
                 if progress_callback:
@@ -1212,75 +1857,44 @@ class ReportsManager:
                         if progress_callback:
                             progress_callback("Encountered access restrictions - using alternative tracking methods")
                 
+                # Only agents created before the cutoff need a last login lookup
+                candidates = self._inactivity_candidates(agents, 'agent', cutoff_date)
+                stats['agents_older_than_threshold'] = len(candidates)
+                
                 # Process agents in smaller batches to avoid overwhelming the API
                 batch_size = 25
-                total_batches = (len(agents) + batch_size - 1) // batch_size
+                total_batches = (len(candidates) + batch_size - 1) // batch_size
                 
-                for batch_num, batch_start in enumerate(range(0, len(agents), batch_size), 1):
-                    batch = agents[batch_start:batch_start + batch_size]
+                for batch_num, batch_start in enumerate(range(0, len(candidates), batch_size), 1):
+                    batch = candidates[batch_start:batch_start + batch_size]
                     self.logger.info(f"Processing agent batch {batch_num}/{total_batches} ({len(batch)} agents)")
                     
                     if progress_callback:
                         progress_callback(f"Processing agent batch {batch_num}/{total_batches} ({len(batch)} agents)")
                     
-                    for agent in batch:
-                        # Skip processing if the agent was created after the cutoff date
-                        # (they can't be inactive if they were just created)
-                        created_at = agent.get('created_at')
-                        try:
-                            if created_at:
-                                created_date = datetime.datetime.strptime(created_at, "%Y-%m-%dT%H:%M:%SZ")
-                                if created_date > cutoff_date:
-                                    self.logger.debug(f"Skipping recently created agent {agent.get('id')}")
-                                    continue
-                        except Exception:
-                            pass
-                            
-                        last_login = self._get_user_last_login(agent.get('id'))
-                        
-                        # If there's no last login data, consider the user inactive
-                        if not last_login:
-                            stats['users_without_login_data'] += 1
-                            inactive_users.append({
-                                'id': agent.get('id'),
-                                'first_name': agent.get('first_name', ''),
-                                'last_name': agent.get('last_name', ''),
-                                'email': agent.get('email'),
-                                'last_login': None,
-                                'days_inactive': 'Unknown',
-                                'type': 'Agent',
-                                'active': agent.get('active', False),
-                                'created_at': agent.get('created_at')
-                            })
-                            stats['inactive_agents'] += 1
-                            continue
-                        
-                        # Parse the last login date
-                        try:
-                            last_login_date = datetime.datetime.strptime(last_login, "%Y-%m-%dT%H:%M:%SZ")
-                            days_inactive = (datetime.datetime.now() - last_login_date).days
-                            
-                            # Check if the user is inactive based on the threshold
-                            if days_inactive > threshold_days:
-                                inactive_users.append({
-                                    'id': agent.get('id'),
-                                    'first_name': agent.get('first_name', ''),
-                                    'last_name': agent.get('last_name', ''),
-                                    'email': agent.get('email'),
-                                    'last_login': last_login,
-                                    'days_inactive': days_inactive,
-                                    'type': 'Agent',
-                                    'active': agent.get('active', False),
-                                    'created_at': agent.get('created_at')
-                                })
-                                stats['inactive_agents'] += 1
-                        except Exception as e:
-                            self.logger.error(f"Error parsing last login date for agent {agent.get('id')}: {str(e)}")
-                            stats['users_without_login_data'] += 1
+                    # Fetch the last logins the list payload didn't provide concurrently,
+                    # then classify the batch from the warmed cache
+                    lookups = self._prefetch_last_logins([user for user, _ in batch], 'Agent')
+                    results = [
+                        self._classify_user(user, 'Agent', 'email', threshold_days, start_time)
+                        for user, _ in batch
+                    ]
                     
-                    # Add a small delay between batches to prevent rate limiting
-                    if batch_num < total_batches:
-                        time.sleep(2)
+                    # Count in locals and fold into stats once per batch
+                    no_login_count = 0
+                    inactive_count = 0
+                    for outcome, user_record in results:
+                        if outcome in ('no_login_data', 'parse_error'):
+                            no_login_count += 1
+                        if user_record:
+                            inactive_users.append(user_record)
+                            inactive_count += 1
+                    stats['users_without_login_data'] += no_login_count
+                    stats['inactive_agents'] += inactive_count
+                    
+                    # Pause between batches only when the API's rate limit budget is running low
+                    if lookups and batch_num < total_batches:
+                        self.api_client.wait_for_rate_limit_budget()
                         
                 if progress_callback and stats['inactive_agents'] > 0:
                     progress_callback(f"Found {stats['inactive_agents']} inactive agents")
@@ -1296,8 +1910,7 @@ class ReportsManager:
                 if progress_callback:
                     progress_callback("Retrieving requester list...")
                     
-                requesters = self._get_all_requesters()
-                stats['total_requesters_checked'] = len(requesters)
+                requesters = self._get_all_requesters(created_before=cutoff_date)
                 self.logger.info(f"Checking {len(requesters)} requesters for inactivity")
                 
                 if progress_callback:
@@ -1305,74 +1918,44 @@ class ReportsManager:
                     if using_fallback_methods:
                         progress_callback("Using alternative activity tracking methods for requesters")
                 
+                # Only requesters created before the cutoff need a last login lookup
+                candidates = self._inactivity_candidates(requesters, 'requester', cutoff_date)
+                stats['requesters_older_than_threshold'] = len(candidates)
+                
                 # Process requesters in batches to avoid API rate limits
                 batch_size = 20  # Smaller batch size for requesters as there are usually more
-                total_batches = (len(requesters) + batch_size - 1) // batch_size
+                total_batches = (len(candidates) + batch_size - 1) // batch_size
                 
-                for batch_num, batch_start in enumerate(range(0, len(requesters), batch_size), 1):
-                    batch = requesters[batch_start:batch_start + batch_size]
+                for batch_num, batch_start in enumerate(range(0, len(candidates), batch_size), 1):
+                    batch = candidates[batch_start:batch_start + batch_size]
                     self.logger.info(f"Processing requester batch {batch_num}/{total_batches} ({len(batch)} requesters)")
                     
                     if progress_callback:
                         progress_callback(f"Processing requester batch {batch_num}/{total_batches} ({len(batch)} requesters)")
                     
-                    for requester in batch:
-                        # Skip processing if the requester was created after the cutoff date
-                        created_at = requester.get('created_at')
-                        try:
-                            if created_at:
-                                created_date = datetime.datetime.strptime(created_at, "%Y-%m-%dT%H:%M:%SZ")
-                                if created_date > cutoff_date:
-                                    self.logger.debug(f"Skipping recently created requester {requester.get('id')}")
-                                    continue
-                        except Exception:
-                            pass
-                            
-                        last_login = self._get_user_last_login(requester.get('id'))
-                        
-                        # If there's no last login data, consider the user inactive
-                        if not last_login:
-                            stats['users_without_login_data'] += 1
-                            inactive_users.append({
-                                'id': requester.get('id'),
-                                'first_name': requester.get('first_name', ''),
-                                'last_name': requester.get('last_name', ''),
-                                'email': requester.get('primary_email'),
-                                'last_login': None,
-                                'days_inactive': 'Unknown',
-                                'type': 'Requester',
-                                'active': requester.get('active', False),
-                                'created_at': requester.get('created_at')
-                            })
-                            stats['inactive_requesters'] += 1
-                            continue
-                        
-                        # Parse the last login date
-                        try:
-                            last_login_date = datetime.datetime.strptime(last_login, "%Y-%m-%dT%H:%M:%SZ")
-                            days_inactive = (datetime.datetime.now() - last_login_date).days
-                            
-                            # Check if the user is inactive based on the threshold
-                            if days_inactive > threshold_days:
-                                inactive_users.append({
-                                    'id': requester.get('id'),
-                                    'first_name': requester.get('first_name', ''),
-                                    'last_name': requester.get('last_name', ''),
-                                    'email': requester.get('primary_email'),
-                                    'last_login': last_login,
-                                    'days_inactive': days_inactive,
-                                    'type': 'Requester',
-                                    'active': requester.get('active', False),
-                                    'created_at': requester.get('created_at')
-                                })
-                                stats['inactive_requesters'] += 1
-                        except Exception as e:
-                            self.logger.error(f"Error parsing last login date for requester {requester.get('id')}: {str(e)}")
-                            stats['users_without_login_data'] += 1
+                    # Fetch the last logins the list payload didn't provide concurrently,
+                    # then classify the batch from the warmed cache
+                    lookups = self._prefetch_last_logins([user for user, _ in batch], 'Requester')
+                    results = [
+                        self._classify_user(user, 'Requester', 'primary_email', threshold_days, start_time)
+                        for user, _ in batch
+                    ]
+                    
+                    # Count in locals and fold into stats once per batch
+                    no_login_count = 0
+                    inactive_count = 0
+                    for outcome, user_record in results:
+                        if outcome in ('no_login_data', 'parse_error'):
+                            no_login_count += 1
+                        if user_record:
+                            inactive_users.append(user_record)
+                            inactive_count += 1
+                    stats['users_without_login_data'] += no_login_count
+                    stats['inactive_requesters'] += inactive_count
                     
-                    # Add a small delay between batches to prevent rate limiting
-                    if batch_num < total_batches:
-                        time.sleep(2)
+                    # Pause between batches only when the API's rate limit budget is running low
+                    if lookups and batch_num < total_batches:
+                        self.api_client.wait_for_rate_limit_budget()
                         
                 if progress_callback and stats['inactive_requesters'] > 0:
                     progress_callback(f"Found {stats['inactive_requesters']} inactive requesters")
@@ -1383,10 +1966,15 @@ class ReportsManager:
                     progress_callback(f"Error retrieving requesters: {str(e)}")
         
         # Sort inactive users by days inactive (most inactive first)
-        inactive_users.sort(key=lambda x: 999999 if x['days_inactive'] == 'Unknown' else x['days_inactive'], reverse=True)
+        total_inactive = len(inactive_users)
+        if top_k is not None and top_k < total_inactive:
+            # Only the longest-inactive users are wanted, so skip the full sort
+            inactive_users = heapq.nlargest(max(top_k, 0), inactive_users, key=_INACTIVE_SORT_KEY)
+        else:
+            inactive_users.sort(key=_INACTIVE_SORT_KEY, reverse=True)
         
         if progress_callback:
-            progress_callback(f"Report generation complete. Found {len(inactive_users)} inactive users total.")
+            progress_callback(f"Report generation complete. Found {total_inactive} inactive users total.")
             if using_fallback_methods:
                 progress_callback("Note: Direct login tracking not available - used alternative activity tracking methods")
         
@@ -1395,11 +1983,11 @@ class ReportsManager:
         execution_time = (end_time - start_time).total_seconds()
         
         summary = {
-            'total_inactive_users': len(inactive_users),
+            'total_inactive_users': total_inactive,
             'inactive_agents': stats['inactive_agents'],
             'inactive_requesters': stats['inactive_requesters'],
-            'total_agents_checked': stats['total_agents_checked'],
-            'total_requesters_checked': stats['total_requesters_checked'],
+            'agents_older_than_threshold': stats['agents_older_than_threshold'],
+            'requesters_older_than_threshold': stats['requesters_older_than_threshold'],
             'users_without_login_data': stats['users_without_login_data'],
             'threshold_days': threshold_days,
             'execution_time_seconds': execution_time,
@@ -1409,14 +1997,136 @@ class ReportsManager:
         
         return inactive_users, summary
     
+    def _prefetch_last_logins(self, users, user_type):
+        """
+        Concurrently look up last logins for users whose list payload has no last_login_at.
+        
+        Results land in the last login cache, so a following _classify_user call
+        for the same users doesn't hit the API again.
+        
+        Args:
+            users: List of agent or requester dictionaries
+            user_type: 'Agent' or 'Requester'
+            
+        Returns:
+            Number of users that needed a lookup
+        """
+        needs_lookup = [
+            user.get('id') for user in users
+            if not user.get('last_login_at')
+        ]
+        if not needs_lookup:
+            return 0
+        
+        with ThreadPoolExecutor(max_workers=min(self.LAST_LOGIN_FETCH_WORKERS, len(needs_lookup))) as executor:
+            # Consume the iterator so every lookup finishes before we return
+            list(executor.map(lambda user_id: self._get_user_last_login(user_id, user_type), needs_lookup))
+        
+        return len(needs_lookup)
+    
+    def _inactivity_candidates(self, users, user_type, cutoff_date):
+        """
+        Drop users created after the cutoff date, parsing each creation date once.
+        
+        Args:
+            users: List of agent or requester dictionaries
+            user_type: 'agent' or 'requester', used for logging
+            cutoff_date: Users created after this date are skipped
+            
+        Returns:
+            List of (user, created_date) tuples; created_date is None if unknown
+        """
+        candidates = []
+        for user in users:
+            created_at = user.get('created_at')
+            created_date = None
+            try:
+                if created_at:
+                    created_date = _parse_iso_datetime(created_at)
+                    # They can't be inactive if they were just created
+                    if created_date > cutoff_date:
+                        self.logger.debug(f"Skipping recently created {user_type} {user.get('id')}")
+                        continue
+            except Exception:
+                pass
+            candidates.append((user, created_date))
+        
+        return candidates
+    
+    def _classify_user(self, user, user_type, email_field, threshold_days, now):
+        """
+        Decide whether a single agent or requester is inactive.
+        
+        Safe to call from worker threads: it only reads its arguments and
+        makes API calls, leaving report bookkeeping to the caller.
+        
+        Args:
+            user: Agent or requester dictionary
+            user_type: 'Agent' or 'Requester'
+            email_field: Key holding the user's email address
+            threshold_days: Number of days since last login to consider a user inactive
+            now: Reference time for computing days inactive
+            
+        Returns:
+            Tuple of (outcome, inactive_user_record). Outcome is one of 'no_login_data',
+            'parse_error', 'inactive' or 'active'; the record is None unless the
+            user is inactive.
+        """
+        user_id = user.get('id')
+        created_at = user.get('created_at')
+        
+        # Use the login date from the list payload when it has one; updated_at isn't
+        # used here since admin edits and syncs bump it without the user logging in
+        last_login = user.get('last_login_at')
+        if not last_login:
+            last_login = self._get_user_last_login(user_id, user_type)
+        
+        # If there's no last login data, consider the user inactive
+        if not last_login:
+            return 'no_login_data', InactiveUser(
+                id=user_id,
+                first_name=user.get('first_name', ''),
+                last_name=user.get('last_name', ''),
+                email=user.get(email_field),
+                last_login=None,
+                days_inactive='Unknown',
+                type=user_type,
+                active=user.get('active', False),
+                created_at=created_at
+            )
+        
+        # Parse the last login date
+        try:
+            last_login_date = _parse_iso_datetime(last_login)
+            days_inactive = (now - last_login_date).days
+        except Exception as e:
+            self.logger.error(f"Error parsing last login date for {user_type.lower()} {user_id}: {str(e)}")
+            return 'parse_error', None
+        
+        # Check if the user is inactive based on the threshold
+        if days_inactive > threshold_days:
+            return 'inactive', InactiveUser(
+                id=user_id,
+                first_name=user.get('first_name', ''),
+                last_name=user.get('last_name', ''),
+                email=user.get(email_field),
+                last_login=last_login,
+                days_inactive=days_inactive,
+                type=user_type,
+                active=user.get('active', False),
+                created_at=created_at
+            )
+        
+        return 'active', None
+    
     def export_inactive_users_to_csv(self, inactive_users, summary, output_path):
         """
         Export inactive users report to CSV file.
         
         Args:
-            inactive_users: List of inactive user dictionaries
+            inactive_users: List of InactiveUser records
             summary: Report summary dictionary
-            output_path: Path to save the CSV file
+            output_path: Path to save the CSV file (gzip-compressed if it ends in .gz)
             
         Returns:
             Boolean indicating success
@@ -1426,66 +2136,23 @@ class ReportsManager:
             output_dir = os.path.dirname(output_path)
             if output_dir and not os.path.exists(output_dir):
                 os.makedirs(output_dir)
-                
-            # Define CSV fields
-            fieldnames = [
-                'ID', 'First Name', 'Last Name', 'Email', 'Type', 
-                'Account Status', 'Days Inactive', 'Last Login', 'Created At', 
-                'Job Title', 'Department', 'Location'
-            ]
             
-            # Format date nicely for CSV
-            def format_date(date_str):
-                if not date_str:
-                    return "Never"
-                    
-                try:
-                    dt = datetime.datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%SZ")
-                    return dt.strftime("%Y-%m-%d %H:%M:%S")
-                except Exception:
-                    return date_str
-            
-            # Write CSV file
-            with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                # Add report metadata as comments
-                csvfile.write(f"# Inactive Users Report\n")
-                csvfile.write(f"# Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                csvfile.write(f"# Inactivity Threshold: {summary.get('threshold_days', 'Unknown')} days\n")
-                csvfile.write(f"# Total Inactive Users: {len(inactive_users)}\n")
-                if 'inactive_agents' in summary:
-                    csvfile.write(f"# Inactive Agents: {summary.get('inactive_agents', 0)} of {summary.get('total_agents_checked', 0)}\n")
-                if 'inactive_requesters' in summary:
-                    csvfile.write(f"# Inactive Requesters: {summary.get('inactive_requesters', 0)} of {summary.get('total_requesters_checked', 0)}\n")
-                csvfile.write(f"# Users Without Login Data: {summary.get('users_without_login_data', 0)}\n")
-                csvfile.write(f"# Execution Time: {summary.get('execution_time_seconds', 0):.2f} seconds\n")
-                if summary.get('using_alternative_methods'):
-                    csvfile.write(f"# NOTE: Direct login tracking was not available. Alternative activity tracking methods were used.\n")
-                    csvfile.write(f"# This may result in less accurate last activity dates, often using the most recent ticket update\n")
-                    csvfile.write(f"# or account creation date as a proxy for user activity.\n")
-                csvfile.write("\n")
-                
-                # Write report data
-                for user in inactive_users:
-                    account_status = 'Active' if user.get('active', False) else 'Inactive'
-                    
-                    row = {
-                        'ID': user.get('id', ''),
-                        'First Name': user.get('first_name', ''),
-                        'Last Name': user.get('last_name', ''),
-                        'Email': user.get('email', ''),
-                        'Type': user.get('type', ''),
-                        'Account Status': account_status,
-                        'Days Inactive': user.get('days_inactive', ''),
-                        'Last Login': format_date(user.get('last_login')),
-                        'Created At': format_date(user.get('created_at')),
-                        'Job Title': user.get('job_title', ''),
-                        'Department': user.get('department', ''),
-                        'Location': user.get('location', '')
-                    }
-                    writer.writerow(row)
+            # Compress in the same pass when a .gz file is requested. A low level keeps
+            # the CPU cost small, and periodic flushes are skipped as they hurt the ratio.
+            compress = output_path.endswith('.gz')
+            if compress:
+                csvfile = gzip.open(output_path, 'wb', compresslevel=3)
+            else:
+                csvfile = open(output_path, 'wb', buffering=1 << 20)
+            
+            # Write CSV file as UTF-8 bytes, encoding one block of rows at a time
+            chunks_per_flush = max(1, self.CSV_FLUSH_EVERY_ROWS // self.CSV_WRITE_CHUNK_ROWS)
+            with csvfile:
+                chunks = self.stream_inactive_users_to_csv(inactive_users, summary)
+                for chunk_num, chunk in enumerate(chunks):
+                    csvfile.write(chunk.encode('utf-8'))
+                    if not compress and chunk_num and chunk_num % chunks_per_flush == 0:
+                        csvfile.flush()
                     
             self.logger.info(f"Successfully exported inactive users report to {output_path}")
             return True
@@ -1494,124 +2161,306 @@ class ReportsManager:
             self.logger.error(f"Error exporting inactive users report: {str(e)}")
             return False
     
-    def _get_all_agents(self):
+    def stream_inactive_users_to_csv(self, inactive_users, summary):
         """
-        Get all agents from FreshService API.
+        Produce the inactive users CSV as a sequence of text chunks.
+        
+        Suitable for chunked HTTP responses or writing to any stream without
+        building the whole document in memory.
+        
+        Args:
+            inactive_users: List of InactiveUser records
+            summary: Report summary dictionary
+            
+        Yields:
+            CSV text chunks: the header and metadata first, then blocks of rows
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        
+        self._write_inactive_users_preamble(buffer, writer, inactive_users, summary)
+        yield buffer.getvalue()
+        
+        rows = self._iter_inactive_user_rows(inactive_users)
+        while True:
+            chunk = list(islice(rows, self.CSV_WRITE_CHUNK_ROWS))
+            if not chunk:
+                break
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(chunk)
+            yield buffer.getvalue()
+    
+    def _write_inactive_users_preamble(self, csvfile, writer, inactive_users, summary):
+        """
+        Write the column headers and report metadata comments of the inactive users CSV.
         
+        Args:
+            csvfile: Text stream being written
+            writer: csv.writer bound to csvfile
+            inactive_users: List of InactiveUser records
+            summary: Report summary dictionary
+        """
+        writer.writerow(_INACTIVE_USERS_CSV_HEADERS)
+        
+        # Add report metadata as comments, written in one call
+        metadata_lines = [
+            "# Inactive Users Report\n",
+            f"# Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"# Inactivity Threshold: {summary.get('threshold_days', 'Unknown')} days\n",
+            f"# Total Inactive Users: {len(inactive_users)}\n",
+        ]
+        if 'inactive_agents' in summary:
+            metadata_lines.append(
+                f"# Inactive Agents: {summary.get('inactive_agents', 0)} of {summary.get('agents_older_than_threshold', 0)}"
+                f" created more than {summary.get('threshold_days', 'Unknown')} days ago\n"
+            )
+        if 'inactive_requesters' in summary:
+            metadata_lines.append(
+                f"# Inactive Requesters: {summary.get('inactive_requesters', 0)} of {summary.get('requesters_older_than_threshold', 0)}"
+                f" created more than {summary.get('threshold_days', 'Unknown')} days ago\n"
+            )
+        metadata_lines.append(f"# Users Without Login Data: {summary.get('users_without_login_data', 0)}\n")
+        metadata_lines.append(f"# Execution Time: {summary.get('execution_time_seconds', 0):.2f} seconds\n")
+        if summary.get('using_alternative_methods'):
+            metadata_lines.append("# NOTE: Direct login tracking was not available. Alternative activity tracking methods were used.\n")
+            metadata_lines.append("# This may result in less accurate last activity dates, often using the most recent ticket update\n")
+            metadata_lines.append("# or account creation date as a proxy for user activity.\n")
+        metadata_lines.append("\n")
+        csvfile.writelines(metadata_lines)
+    
+    def _iter_inactive_user_rows(self, inactive_users):
+        """
+        Yield inactive users as positional CSV rows.
+        
+        Args:
+            inactive_users: List of InactiveUser records
+            
+        Yields:
+            Tuple of column values in _INACTIVE_USERS_CSV_HEADERS order
+        """
+        format_date = _format_inactive_user_date
+        user_fields = list(map(_INACTIVE_USER_CSV_FIELDS, inactive_users))
+        
+        # Format every date in one pass up front so the row loop only copies values
+        last_logins = list(map(format_date, map(itemgetter(7), user_fields)))
+        created_dates = list(map(format_date, map(itemgetter(8), user_fields)))
+        
+        for fields, last_login, created_at in zip(user_fields, last_logins, created_dates):
+            user_id, first_name, last_name, email, user_type, active, days_inactive = fields[:7]
+            # Job title, department and location aren't collected for the report
+            yield (
+                user_id,
+                first_name,
+                last_name,
+                email,
+                user_type,
+                'Active' if active else 'Inactive',
+                days_inactive,
+                last_login,
+                created_at,
+                '',
+                '',
+                ''
+            )
+    
+    def _get_all_pages(self, endpoint, result_key, query=None):
+        """
+        Get every page of a list endpoint, fetching pages concurrently after the first.
+        
+        The API doesn't report a total, so pages are requested in windows of
+        PAGE_FETCH_WORKERS and collection stops at the first short or empty page.
+        
+        Args:
+            endpoint: List endpoint to page through (e.g. 'agents')
+            result_key: Key holding the records in each response
+            query: Optional server-side filter query (e.g. "created_at:<'2024-01-01'")
+            
         Returns:
-            List of agents
+            List of records in page order, or None if the first page could not be fetched
         """
-        self.logger.info("Getting all agents")
+        cache_key = (endpoint, query)
+        entry = self._cache_get(self._user_list_cache, cache_key, self.USER_CACHE_TTL)
+        if entry:
+            self.logger.debug(f"Using cached {result_key} list")
+            return list(entry[1])
         
-        agents = []
-        page = 1
         per_page = 100  # Maximum value allowed
+        base_params = {'per_page': per_page}
+        if query:
+            base_params['query'] = f'"{query}"'
         
-        while True:
+        def fetch_page(page):
             try:
                 result = self.api_client._make_request(
                     'GET',
-                    'agents',
-                    params={'page': page, 'per_page': per_page},
+                    endpoint,
+                    params=dict(base_params, page=page),
                     workspace_id=None
                 )
-                
-                if not isinstance(result, dict) or 'agents' not in result:
-                    break
-                    
-                batch = result.get('agents', [])
-                if not batch:
-                    break
-                    
-                agents.extend(batch)
-                
-                # Check if we've reached the last page
-                if len(batch) < per_page:
-                    break
-                    
-                page += 1
-                
             except Exception as e:
-                self.logger.error(f"Error retrieving agents page {page}: {str(e)}")
-                break
-                
+                self.logger.error(f"Error retrieving {result_key} page {page}: {str(e)}")
+                return None
+            
+            if not isinstance(result, dict) or result_key not in result:
+                return None
+            return result.get(result_key, [])
+        
+        # The first page tells us whether there is anything more to fetch
+        records = []
+        batch = fetch_page(1)
+        if batch is None:
+            return None
+        records.extend(batch)
+        
+        if batch and len(batch) == per_page:
+            window = self.PAGE_FETCH_WORKERS
+            next_page = 2
+            done = False
+            with ThreadPoolExecutor(max_workers=window) as executor:
+                while not done:
+                    # Concatenate in page order, stopping at the first short or empty page
+                    for batch in executor.map(fetch_page, range(next_page, next_page + window)):
+                        if not batch:
+                            done = True
+                            break
+                        records.extend(batch)
+                        if len(batch) < per_page:
+                            done = True
+                            break
+                    next_page += window
+        
+        # Don't cache a list that was cut short by a failed page
+        if batch is not None:
+            self._cache_put(
+                self._user_list_cache, cache_key, records,
+                self.USER_CACHE_TTL, self.USER_LIST_CACHE_SIZE
+            )
+        return list(records)
+    
+    def _get_filtered_pages(self, endpoint, created_before=None):
+        """
+        Get a user list, letting the server drop users created after a cutoff.
+        
+        Falls back to an unfiltered fetch if the filtered request fails, so
+        callers must still apply their own cutoff to the result.
+        
+        Args:
+            endpoint: User list endpoint ('agents' or 'requesters')
+            created_before: Optional datetime; users created after it may be skipped
+            
+        Returns:
+            List of user records
+        """
+        if created_before is not None:
+            # The filter only has day granularity, so include the whole cutoff day
+            day_after = (created_before + datetime.timedelta(days=1)).strftime('%Y-%m-%d')
+            records = self._get_all_pages(endpoint, endpoint, query=f"created_at:<'{day_after}'")
+            if records is not None:
+                return records
+            self.logger.warning(f"Filtered {endpoint} request failed, falling back to a full scan")
+        
+        return self._get_all_pages(endpoint, endpoint) or []
+    
+    def _get_all_agents(self, created_before=None):
+        """
+        Get all agents from FreshService API.
+        
+        Args:
+            created_before: Optional datetime; agents created after it may be skipped
+            
+        Returns:
+            List of agents
+        """
+        self.logger.info("Getting all agents")
+        agents = self._get_filtered_pages('agents', created_before)
         self.logger.info(f"Retrieved {len(agents)} agents")
         return agents
     
-    def _get_all_requesters(self):
+    def _get_all_requesters(self, created_before=None):
         """
         Get all requesters from FreshService API.
         
+        Args:
+            created_before: Optional datetime; requesters created after it may be skipped
+            
         Returns:
             List of requesters
         """
         self.logger.info("Getting all requesters")
-        
-        requesters = []
-        page = 1
-        per_page = 100  # Maximum value allowed
-        
-        while True:
-            try:
-                result = self.api_client._make_request(
-                    'GET',
-                    'requesters',
-                    params={'page': page, 'per_page': per_page},
-                    workspace_id=None
-                )
-                
-                if not isinstance(result, dict) or 'requesters' not in result:
-                    break
-                    
-                batch = result.get('requesters', [])
-                if not batch:
-                    break
-                    
-                requesters.extend(batch)
-                
-                # Check if we've reached the last page
-                if len(batch) < per_page:
-                    break
-                    
-                page += 1
-                
-            except Exception as e:
-                self.logger.error(f"Error retrieving requesters page {page}: {str(e)}")
-                break
-                
+        requesters = self._get_filtered_pages('requesters', created_before)
         self.logger.info(f"Retrieved {len(requesters)} requesters")
         return requesters
     
-    def _get_user_last_login(self, user_id):
+    def _get_user_last_login(self, user_id, user_type=None):
         """
-        Get the last login date for a user.
+        Get the last login date for a user, reusing earlier lookups.
         
         Args:
             user_id: User ID
+            user_type: 'Agent' or 'Requester' if known, None otherwise
             
         Returns:
             Last login date string or None if not found
         """
+        entry = self._cache_get(self._last_login_cache, user_id, self.USER_CACHE_TTL)
+        if entry:
+            return entry[1]
+        
+        # Fall back to lookups saved by earlier runs before calling the API
+        found, last_login = self._read_disk_last_login(user_id)
+        if not found:
+            completed, last_login = self._fetch_user_last_login(user_id, user_type)
+            if not completed:
+                # A transient failure isn't an answer; don't cache it so the next call retries
+                return last_login
+            self._write_disk_last_login(user_id, last_login)
+        
+        self._cache_put(
+            self._last_login_cache, user_id, last_login,
+            self.USER_CACHE_TTL, self.LAST_LOGIN_CACHE_SIZE
+        )
+        return last_login
+    
+    def _fetch_user_last_login(self, user_id, user_type=None):
+        """
+        Look up the last login date for a user from the API.
+        
+        Args:
+            user_id: User ID
+            user_type: 'Agent' or 'Requester' if known, None otherwise
+            
+        Returns:
+            Tuple of (completed, last login date string or None). completed is False
+            when a request failed for a reason other than 404 (rate limit, server or
+            network error), so a None result isn't a real "no login data" answer.
+        """
+        completed = True
         try:
-            # First approach: Try to get user details which sometimes include last_login_at
-            result = self.api_client._make_request(
-                'GET',
-                f'requesters/{user_id}',
-                workspace_id=None
-            )
+            result = None
             
-            if isinstance(result, dict) and 'requester' in result:
-                requester = result.get('requester', {})
-                # Check for last_login_at field
-                if requester.get('last_login_at'):
-                    return requester.get('last_login_at')
+            # First approach: Try to get user details which sometimes include last_login_at
+            # (skipped when we already know the user is an agent)
+            if user_type != 'Agent':
+                result = self.api_client._make_request(
+                    'GET',
+                    f'requesters/{user_id}',
+                    workspace_id=None
+                )
                 
-                # Check for updated_at as a fallback
-                if requester.get('updated_at'):
-                    return requester.get('updated_at')
+                if isinstance(result, dict) and 'requester' in result:
+                    requester = result.get('requester', {})
+                    # Check for last_login_at field
+                    if requester.get('last_login_at'):
+                        return completed, requester.get('last_login_at')
+                    
+                    # Check for updated_at as a fallback
+                    if requester.get('updated_at'):
+                        return completed, requester.get('updated_at')
                     
             # Second approach: Try to get agent details which might include last_login_at
-            if user_id:
+            # (pointless when we already know the user is a requester)
+            if user_id and user_type != 'Requester':
                 try:
                     result = self.api_client._make_request(
                         'GET',
@@ -1623,14 +2472,20 @@ class ReportsManager:
                         agent = result.get('agent', {})
                         # Check for last_login_at field
                         if agent.get('last_login_at'):
-                            return agent.get('last_login_at')
+                            return completed, agent.get('last_login_at')
                         
                         # Check for updated_at as a fallback
                         if agent.get('updated_at'):
-                            return agent.get('updated_at')
-                except:
-                    # Ignore errors when checking agent details
-                    pass
+                            return completed, agent.get('updated_at')
+                except Exception as e:
+                    # Ignore errors when checking agent details, but remember transient ones
+                    if not is_not_found_error(e):
+                        completed = False
+            
+            # Known agents stop here: a requester ticket lookup by agent ID doesn't
+            # reflect their activity, and the ticket result never supplied a fallback date
+            if user_type == 'Agent':
+                return completed, None
             
             # Third approach: Check recent ticket activity as a proxy for user activity
             # This is less accurate but provides a fallback when audit logs aren't available
@@ -1650,23 +2505,24 @@ class ReportsManager:
                 
                 if isinstance(result, dict) and 'tickets' in result and result['tickets']:
                     # Return the most recent ticket creation date as a proxy for activity
-                    return result['tickets'][0].get('created_at')
-            except:
-                # Ignore errors when checking ticket activity
-                pass
+                    return completed, result['tickets'][0].get('created_at')
+            except Exception as e:
+                # Ignore errors when checking ticket activity, but remember transient ones
+                if not is_not_found_error(e):
+                    completed = False
                 
             # If we reach here, we couldn't find any login or activity information
             # Fall back to created_at date from user object
             if isinstance(result, dict):
                 if 'requester' in result and result['requester'].get('created_at'):
-                    return result['requester'].get('created_at')
+                    return completed, result['requester'].get('created_at')
                 elif 'agent' in result and result['agent'].get('created_at'):
-                    return result['agent'].get('created_at')
+                    return completed, result['agent'].get('created_at')
             
             # We couldn't determine last login time
-            return None
+            return completed, None
             
         except Exception as e:
             self.logger.error(f"Error getting last login for user {user_id}: {str(e)}")
             # If all methods fail, return None indicating we couldn't determine activity
-            return None 
\ No newline at end of file
+            return is_not_found_error(e), None 
\ No newline at end of file
@@ -10,9 +10,19 @@ Handles user-related operations in FreshService.
 import logging
 import re
 import json
+import time
+import threading
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Any, Tuple
 
-from .api_client import FreshServiceAPI
+from .api_client import FreshServiceAPI, is_not_found_error
+
+# Email format accepted by get_user_by_email
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', re.ASCII)
+
+# A cached user listing with lowercased names laid out in parallel lists for name matching
+_Roster = namedtuple('_Roster', ['users', 'first_names', 'last_names', 'ids'])
 
 
 class UserManager:
@@ -21,6 +31,29 @@ class UserManager:
     Provides functionality for looking up, creating, updating, and deactivating users.
     """
     
+    # How long looked-up users are reused before asking the API again (seconds)
+    USER_CACHE_TTL = 300
+    # Maximum number of entries kept in each user lookup cache
+    USER_CACHE_SIZE = 1024
+    # How long an ID found in neither requesters nor agents is reported missing without asking again (seconds)
+    MISSING_USER_TTL = 60
+    # Maximum number of remembered missing user IDs
+    MISSING_USER_CACHE_SIZE = 4096
+    # Maximum number of remembered agent/requester checks
+    AGENT_STATUS_CACHE_SIZE = 4096
+    # How long the set of all agent IDs loaded for bulk updates is trusted (seconds)
+    AGENT_IDS_TTL = 300
+    # How long full requester/agent listings are reused by name searches (seconds)
+    ROSTER_CACHE_TTL = 60
+    # Pages of each listing read for name-search fallbacks; every page is a rate-limited
+    # request, so large tenants are searched over their first ROSTER_MAX_PAGES * 100 users
+    ROSTER_MAX_PAGES = 5
+    # Number of agent list pages requested at once by get_all_agents
+    PAGE_FETCH_WORKERS = 5
+    # Default number of users processed at once by the bulk operations
+    # (half the API client's connection pool, leaving room for other requests)
+    BULK_WORKERS = FreshServiceAPI.HTTP_POOL_SIZE // 2
+    
     def __init__(
         self, 
         api_client: FreshServiceAPI, 
@@ -41,8 +74,23 @@ class UserManager:
         self.workspace_id = workspace_id
         self.logger = logger
         self.dry_run = dry_run
-        self.recent_users = []  # Cache for recently accessed users
+        # Recently accessed users by ID, least recent first (see get_recent_users)
+        self.recent_users: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
         self.max_recent_users = 10  # Maximum number of recent users to track
+        # Lookup caches: user ID / lowercased email -> (fetch time, user)
+        self._id_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+        self._email_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # IDs of every agent, loaded once for bulk updates (None until loaded)
+        self._agent_ids: Optional[frozenset] = None
+        self._agent_ids_loaded_at = 0.0
+        # User IDs that both endpoints answered with 404: user ID -> time of the lookup
+        self._missing_users: Dict[int, float] = {}
+        # Known agent status by user ID, so repeated updates don't re-probe the API
+        self._agent_status: Dict[int, bool] = {}
+        # Full listings for name searches: (endpoint, workspace ID) -> (fetch time, _Roster)
+        self._roster_cache: Dict[Tuple[str, int], Tuple[float, _Roster]] = {}
+        # Guards the caches above and recent_users when bulk operations run in threads
+        self._cache_lock = threading.RLock()
     
     def get_user_by_id(self, user_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -54,41 +102,73 @@ class UserManager:
         Returns:
             User dictionary if found, None otherwise
         """
-        try:
-            # Try requester endpoint first
+        cached_user = self._get_cached_user(self._id_cache, user_id)
+        if cached_user is not None:
+            self.logger.debug(f"Using cached user with ID {user_id}")
+            self._add_to_recent_users(cached_user)
+            return cached_user
+        
+        missed_at = self._missing_users.get(user_id)
+        if missed_at is not None and time.time() - missed_at < self.MISSING_USER_TTL:
+            self.logger.warning(f"User with ID {user_id} not found in either requesters or agents")
+            return None
+        
+        # Endpoints that answered 404, to tell a missing user from a failed lookup
+        not_found = []
+        
+        def find_requester():
             try:
                 self.logger.debug(f"Trying to find user with ID {user_id} in requesters...")
                 response = self.api_client.get(
                     f"requesters/{user_id}",
-                    workspace_id=self.workspace_id
+                    workspace_id=self.workspace_id,
+                    quiet_404=True  # Expected when the user is the other kind
                 )
-                user = response.get("requester")
-                
-                if user:
-                    self.logger.debug(f"Found user with ID {user_id} in requesters")
-                    self._add_to_recent_users(user)
-                    return user
+                return response.get("requester")
             except Exception as e:
                 self.logger.debug(f"User ID {user_id} not found in requesters: {e}")
-            
-            # Then try agent endpoint
+                if is_not_found_error(e):
+                    not_found.append("requesters")
+                return None
+        
+        def find_agent():
             try:
                 self.logger.debug(f"Trying to find user with ID {user_id} in agents...")
                 response = self.api_client.get(
                     f"agents/{user_id}",
-                    workspace_id=self.workspace_id
+                    workspace_id=self.workspace_id,
+                    quiet_404=True  # Expected when the user is the other kind
                 )
-                user = response.get("agent")
-                
-                if user:
-                    self.logger.debug(f"Found user with ID {user_id} in agents")
-                    self._add_to_recent_users(user)
-                    return user
+                return response.get("agent")
             except Exception as e:
                 self.logger.debug(f"User ID {user_id} not found in agents: {e}")
+                if is_not_found_error(e):
+                    not_found.append("agents")
+                return None
+        
+        try:
+            # Requesters first; the agents endpoint is only queried when that misses
+            user = find_requester()
+            if user:
+                self.logger.debug(f"Found user with ID {user_id} in requesters")
+                self._cache_user(self._id_cache, user_id, user)
+                if "is_agent" in user:
+                    self._remember_agent_status(user_id, bool(user["is_agent"]))
+                self._add_to_recent_users(user)
+                return user
+            
+            user = find_agent()
+            if user:
+                self.logger.debug(f"Found user with ID {user_id} in agents")
+                self._cache_user(self._id_cache, user_id, user)
+                self._remember_agent_status(user_id, True)
+                self._add_to_recent_users(user)
+                return user
             
             # If we reach this point, user wasn't found
             self.logger.warning(f"User with ID {user_id} not found in either requesters or agents")
+            if len(not_found) == 2:
+                self._remember_missing_user(user_id)
             return None
                 
         except Exception as e:
@@ -106,44 +186,37 @@ class UserManager:
             User dictionary if found, None otherwise
         """
         try:
-            # Email validation
-            if not self._is_valid_email(email):
+            # Email validation (cheap checks first, so blank or obviously bad input skips the regex)
+            if not email or '@' not in email or len(email) > 254 or not self._is_valid_email(email):
                 self.logger.warning(f"Invalid email format: {email}")
                 return None
             
-            # Try to find user in requesters first
-            try:
-                response = self.api_client.get(
-                    "requesters",
-                    params={"email": email},
-                    workspace_id=self.workspace_id
-                )
-                
-                users = response.get("requesters", [])
-                
-                if users and len(users) > 0:
-                    user = users[0]  # Take the first match
-                    self._add_to_recent_users(user)
-                    return user
-            except Exception as e:
-                self.logger.warning(f"Error searching requester: {e}")
+            email_key = email.lower()
+            cached_user = self._get_cached_user(self._email_cache, email_key)
+            if cached_user is not None:
+                self.logger.debug(f"Using cached user with email {email}")
+                self._add_to_recent_users(cached_user)
+                return cached_user
             
-            # If not found, try agents endpoint with include_agents=true
+            # With include_agents=true the requesters endpoint lists requesters and
+            # agents alike, so one request covers both
             try:
                 response = self.api_client.get(
                     "requesters",
                     params={"email": email, "include_agents": "true"},
                     workspace_id=self.workspace_id
                 )
-                
                 users = response.get("requesters", [])
-                
-                if users and len(users) > 0:
-                    user = users[0]  # Take the first match
-                    self._add_to_recent_users(user)
-                    return user
             except Exception as e:
-                self.logger.warning(f"Error searching agent: {e}")
+                self.logger.warning(f"Error searching users by email: {e}")
+                users = []
+            
+            if users:
+                # A plain requester match takes priority, as when requesters were searched first
+                user = next((u for u in users if not u.get("is_agent")), users[0])
+                self._cache_user(self._email_cache, email_key, user)
+                self._add_to_recent_users(user)
+                return user
             
             self.logger.warning(f"No user found with email: {email}")
             return None
@@ -221,25 +294,10 @@ class UserManager:
                     try:
                         self.logger.debug("Fetching all requesters as fallback")
                         # Just get all requesters and filter manually
-                        response = self.api_client.get(
-                            "requesters",
-                            workspace_id=self.workspace_id
-                        )
-                        
-                        # Filter locally instead of via API
-                        all_requesters = response.get("requesters", [])
+                        all_requesters = self._get_roster_index("requesters")
                         
                         # Filter based on name case-insensitively
-                        filtered_requesters = []
-                        for user in all_requesters:
-                            user_first = (user.get("first_name", "") or "").lower()
-                            user_last = (user.get("last_name", "") or "").lower()
-                            
-                            first_match = not first_name or first_name.lower() in user_first
-                            last_match = not last_name or last_name.lower() in user_last
-                            
-                            if first_match and last_match:
-                                filtered_requesters.append(user)
+                        filtered_requesters = self._filter_roster_by_name(all_requesters, first_name, last_name)
                                 
                         all_users.extend(filtered_requesters)
                         
@@ -251,6 +309,9 @@ class UserManager:
                     except Exception as e2:
                         self.logger.warning(f"Error in fallback requester search: {e2}")
             
+            # IDs already found as requesters, so agents aren't listed twice
+            requester_ids = {user.get("id") for user in all_users}
+            
             # Then try to search agents 
             try:
                 self.logger.debug(f"Searching agents with query: {query_string}")
@@ -261,7 +322,6 @@ class UserManager:
                 )
                 
                 # Filter out any requesters already added (to avoid duplicates)
-                requester_ids = {user.get("id") for user in all_users}
                 agents = [
                     user for user in response.get("requesters", []) 
                     if user.get("id") not in requester_ids and user.get("is_agent", False)
@@ -284,25 +344,12 @@ class UserManager:
                     try:
                         self.logger.debug("Fetching all agents as fallback")
                         # Get all agents and filter manually
-                        response = self.api_client.get(
-                            "agents",
-                            workspace_id=self.workspace_id
-                        )
-                        
-                        # Filter locally instead of via API
-                        all_agents = response.get("agents", [])
+                        all_agents = self._get_roster_index("agents")
                         
                         # Filter based on name case-insensitively
-                        filtered_agents = []
-                        for user in all_agents:
-                            user_first = (user.get("first_name", "") or "").lower()
-                            user_last = (user.get("last_name", "") or "").lower()
-                            
-                            first_match = not first_name or first_name.lower() in user_first
-                            last_match = not last_name or last_name.lower() in user_last
-                            
-                            if first_match and last_match and user.get("id") not in requester_ids:
-                                filtered_agents.append(user)
+                        filtered_agents = self._filter_roster_by_name(
+                            all_agents, first_name, last_name, skip_ids=requester_ids
+                        )
                                 
                         all_users.extend(filtered_agents)
                         
@@ -332,6 +379,37 @@ class UserManager:
                     self.logger.error(f"Fuzzy search fallback also failed: {str(fuzzy_err)}")
             return []
     
+    def _filter_roster_by_name(
+        self,
+        roster: _Roster,
+        first_name: Optional[str],
+        last_name: Optional[str],
+        skip_ids: Any = ()
+    ) -> List[Dict[str, Any]]:
+        """
+        Find roster users whose names contain the search terms, ignoring case.
+        
+        Args:
+            roster: Roster to filter
+            first_name: First name to look for (None or empty matches any)
+            last_name: Last name to look for (None or empty matches any)
+            skip_ids: IDs of users to leave out
+            
+        Returns:
+            List of matching user dictionaries in roster order
+        """
+        # An empty term is contained in every name, so it matches any user
+        search_first = first_name.lower() if first_name else ""
+        search_last = last_name.lower() if last_name else ""
+        users = roster.users
+        ids = roster.ids
+        
+        return [
+            users[index]
+            for index, (user_first, user_last) in enumerate(zip(roster.first_names, roster.last_names))
+            if search_first in user_first and search_last in user_last and ids[index] not in skip_ids
+        ]
+    
     def _fuzzy_name_search(
         self, 
         first_name: Optional[str] = None, 
@@ -348,7 +426,8 @@ class UserManager:
             List of matching user dictionaries
         """
         try:
-            all_users = []
+            # (roster, IDs to skip) pairs to search, in priority order
+            pools = []
             
             # If both first_name and last_name are None, return empty list
             if first_name is None and last_name is None:
@@ -357,66 +436,52 @@ class UserManager:
             # Normalize search terms to lowercase if they exist
             search_first_name = first_name.lower() if first_name else ""
             search_last_name = last_name.lower() if last_name else ""
+            search_first_len = len(search_first_name)
+            search_last_len = len(search_last_name)
             
             # First try to get all requesters - this is just to get a pool of users to search
+            requester_ids = set()
             try:
-                response = self.api_client.get(
-                    "requesters",
-                    workspace_id=self.workspace_id
-                )
-                
-                requesters = response.get("requesters", [])
-                all_users.extend(requesters or [])
+                requesters = self._get_roster_index("requesters")
+                requester_ids = set(requesters.ids)
+                pools.append((requesters, ()))
             except Exception as e:
                 self.logger.debug(f"Error fetching requesters for fuzzy search: {e}")
             
-            # Then try to get all agents
+            # Then try to get all agents, skipping any already listed as requesters
             try:
-                response = self.api_client.get(
-                    "agents",
-                    workspace_id=self.workspace_id
-                )
-                
-                agents = response.get("agents", [])
-                # Avoid duplicates
-                agent_ids = {agent.get("id") for agent in agents or []}
-                requester_ids = {user.get("id") for user in all_users}
-                
-                for agent in agents or []:
-                    if agent.get("id") not in requester_ids:
-                        all_users.append(agent)
+                agents = self._get_roster_index("agents")
+                pools.append((agents, requester_ids))
             except Exception as e:
                 self.logger.debug(f"Error fetching agents for fuzzy search: {e}")
             
-            # Now perform fuzzy search on the combined list
+            # Now perform fuzzy search over the precomputed lowercase names
             matches = []
             
-            for user in all_users:
-                user_first = (user.get("first_name") or "").lower()
-                user_last = (user.get("last_name") or "").lower()
-                
-                # Determine match score
-                match_score = 0
-                
-                # Check first name
-                if search_first_name and search_first_name in user_first:
-                    # Exact match or contained within
-                    if user_first == search_first_name:
-                        match_score += 2
-                    else:
-                        match_score += 1
-                
-                # Check last name
-                if search_last_name and search_last_name in user_last:
-                    # Exact match or contained within
-                    if user_last == search_last_name:
-                        match_score += 2
-                    else:
-                        match_score += 1
-                
-                # Add user if we have a match
-                if match_score > 0:
-                    matches.append(user)
+            for roster, skip_ids in pools:
+                for index, (user_first, user_last) in enumerate(zip(roster.first_names, roster.last_names)):
+                    # Determine match score
+                    match_score = 0
+                    
+                    # Check first name: exact match or contained within (one find per name)
+                    if search_first_name:
+                        position = user_first.find(search_first_name)
+                        if position == 0 and len(user_first) == search_first_len:
+                            match_score += 2
+                        elif position >= 0:
+                            match_score += 1
+                    
+                    # Check last name
+                    if search_last_name:
+                        position = user_last.find(search_last_name)
+                        if position == 0 and len(user_last) == search_last_len:
+                            match_score += 2
+                        elif position >= 0:
+                            match_score += 1
+                    
+                    # Add user if we have a match
+                    if match_score > 0 and roster.ids[index] not in skip_ids:
+                        matches.append(roster.users[index])
             
             # Update recent users for any matches
             for user in matches:
@@ -438,6 +503,15 @@ class UserManager:
         Returns:
             True if user is an agent, False if requester or unknown
         """
+        is_agent = self._agent_status.get(user_id)
+        if is_agent is not None:
+            return is_agent
+        
+        # A loaded agent ID set answers without a request
+        agent_ids = self._agent_ids
+        if agent_ids is not None and time.time() - self._agent_ids_loaded_at < self.AGENT_IDS_TTL:
+            return user_id in agent_ids
+        
         try:
             # Try agent endpoint first
             response = self.api_client.get(
@@ -445,18 +519,71 @@ class UserManager:
                 workspace_id=None  # Don't use workspace_id for user endpoints
             )
             # If we get a successful response, it's an agent
-            return 'agent' in response
-        except Exception:
-            # If we get an error, assume it's not an agent
+            is_agent = 'agent' in response
+            self._remember_agent_status(user_id, is_agent)
+            return is_agent
+        except Exception as e:
+            # If we get an error, assume it's not an agent (only a 404 is worth remembering)
+            if is_not_found_error(e):
+                self._remember_agent_status(user_id, False)
             return False
-            
-    def update_user(self, user_id: int, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    
+    def _load_agent_ids(self) -> Optional[frozenset]:
+        """
+        Load the IDs of all agents so agent checks become set lookups.
+        
+        Worth it for bulk operations, where it replaces one probe request per user
+        with a few pages of the agent list.
+        
+        Returns:
+            Frozenset of agent IDs, or None if the agent list couldn't be fetched
+        """
+        if self._agent_ids is not None and time.time() - self._agent_ids_loaded_at < self.AGENT_IDS_TTL:
+            return self._agent_ids
+        
+        try:
+            agent_ids = frozenset(
+                agent.get("id")
+                for batch in self._iter_user_pages("agents")
+                for agent in batch
+            )
+        except Exception as e:
+            self.logger.warning(f"Could not load agent list, checking users one by one: {e}")
+            return None
+        
+        self.logger.debug(f"Loaded {len(agent_ids)} agent IDs")
+        self._agent_ids = agent_ids
+        self._agent_ids_loaded_at = time.time()
+        return agent_ids
+    
+    def _remember_agent_status(self, user_id: int, is_agent: bool) -> None:
+        """
+        Remember whether a user is an agent, evicting the oldest entry when full.
+        
+        Args:
+            user_id: User ID
+            is_agent: Whether the user is an agent
+        """
+        with self._cache_lock:
+            self._agent_status.pop(user_id, None)
+            self._agent_status[user_id] = is_agent
+            if len(self._agent_status) > self.AGENT_STATUS_CACHE_SIZE:
+                del self._agent_status[next(iter(self._agent_status))]
+            
+    def update_user(
+        self,
+        user_id: int,
+        update_data: Dict[str, Any],
+        user_hint: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Update a user's details.
         
         Args:
             user_id: ID of the user to update
             update_data: Dictionary with fields to update
+            user_hint: The caller's current copy of the user, if it has one. Its
+                is_agent flag is trusted, saving the agent check request.
             
         Returns:
             Updated user dictionary if successful, None otherwise
@@ -464,10 +591,13 @@ class UserManager:
         try:
             # Log the update operation
             self.logger.info(f"Updating user with ID {user_id}")
-            self.logger.debug(f"Original update data: {update_data}")
+            self.logger.debug("Original update data: %s", update_data)
             
             # Check if the user is an agent directly (don't use get_user_by_id to avoid potential issues)
-            is_agent = self._is_agent(user_id)
+            if user_hint and "is_agent" in user_hint:
+                is_agent = bool(user_hint["is_agent"])
+            else:
+                is_agent = self._is_agent(user_id)
             endpoint = "agents" if is_agent else "requesters"
             
             self.logger.info(f"Identified user {user_id} as an {'agent' if is_agent else 'requester'}")
@@ -476,7 +606,7 @@ class UserManager:
             if self.dry_run:
                 self.logger.info(f"DRY RUN: Would update {endpoint[:-1]} {user_id} with {update_data}")
                 # Get current user to simulate updated user
-                current_user = self.get_user_by_id(user_id)
+                current_user = user_hint or self.get_user_by_id(user_id)
                 if current_user:
                     # Simulate update for display purposes
                     simulated_user = current_user.copy()
@@ -494,15 +624,16 @@ class UserManager:
                     # Always ensure department_ids is a list of integers
                     if isinstance(value, list):
                         # Convert all values to integers
-                        processed_data[key] = [int(dept_id) for dept_id in value]
+                        processed_data[key] = list(map(int, value))
                     else:
                         # Convert single value to a list with a single integer
                         processed_data[key] = [int(value)]
                 else:
                     processed_data[key] = value
             
-            # Log the final payload for debugging
-            self.logger.info(f"Final request payload: {json.dumps(processed_data)}")
+            # Log the final payload for debugging (only serialized when INFO is enabled)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Final request payload: %s", json.dumps(processed_data))
             
             # Make the API request with the direct payload format
             self.logger.info(f"Making PUT request to {endpoint}/{user_id}")
@@ -518,6 +649,7 @@ class UserManager:
                 
                 if updated_user:
                     self.logger.info(f"Successfully updated user {user_id}")
+                    self._invalidate_cached_user(user_id)
                     self._add_to_recent_users(updated_user)
                     return updated_user
                 else:
@@ -539,6 +671,43 @@ class UserManager:
                     self.logger.error(f"Error response: {e.response.text}")
             return None
     
+    def update_users_bulk(
+        self,
+        updates: Dict[int, Dict[str, Any]],
+        max_workers: Optional[int] = None
+    ) -> Dict[int, Optional[Dict[str, Any]]]:
+        """
+        Update several users concurrently.
+        
+        Args:
+            updates: Mapping of user ID to the fields to update for that user
+            max_workers: Number of users updated at once (defaults to BULK_WORKERS);
+                lower it if the tenant's rate limit is being hit
+            
+        Returns:
+            Mapping of user ID to the updated user dictionary, or None if that update failed
+        """
+        if not updates:
+            return {}
+        
+        self.logger.info(f"Updating {len(updates)} users")
+        results = dict.fromkeys(updates)  # Keep the caller's order
+        
+        # Classify every user from one agent listing instead of probing each of them
+        self._load_agent_ids()
+        
+        with ThreadPoolExecutor(max_workers=max_workers or self.BULK_WORKERS) as executor:
+            futures = {
+                executor.submit(self.update_user, user_id, update_data): user_id
+                for user_id, update_data in updates.items()
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        failed = sum(1 for user in results.values() if user is None)
+        self.logger.info(f"Bulk update finished: {len(results) - failed} succeeded, {failed} failed")
+        return results
+    
     def deactivate_user(self, user_id: int) -> bool:
         """
         Deactivate a user.
@@ -576,12 +745,14 @@ class UserManager:
             # Check if the operation was successful
             if success:
                 self.logger.info(f"Successfully deactivated user {user_id}")
+                self._invalidate_cached_user(user_id)
+                self._agent_status.pop(user_id, None)
+                self._agent_ids = None
                 
                 # Update the cached user if in recent users
-                for i, user in enumerate(self.recent_users):
-                    if user.get("id") == user_id:
-                        self.recent_users[i]["active"] = False
-                        break
+                recent_user = self.recent_users.get(user_id)
+                if recent_user:
+                    recent_user["active"] = False
                 
                 return True
             else:
@@ -592,6 +763,38 @@ class UserManager:
             self.logger.error(f"Error deactivating user {user_id}: {str(e)}")
             return False
     
+    def deactivate_users_bulk(
+        self,
+        user_ids: List[int],
+        max_workers: Optional[int] = None
+    ) -> Dict[int, bool]:
+        """
+        Deactivate several users concurrently.
+        
+        Each user's lookup and deactivation request run back to back in the same
+        worker, so lookups for some users overlap with deactivations of others.
+        
+        Args:
+            user_ids: IDs of the users to deactivate
+            max_workers: Number of users processed at once (defaults to BULK_WORKERS)
+            
+        Returns:
+            Mapping of user ID to True if deactivated, False otherwise
+        """
+        if not user_ids:
+            return {}
+        
+        self.logger.info(f"Deactivating {len(user_ids)} users")
+        results = dict.fromkeys(user_ids, False)  # Keep the caller's order
+        with ThreadPoolExecutor(max_workers=max_workers or self.BULK_WORKERS) as executor:
+            futures = {executor.submit(self.deactivate_user, user_id): user_id for user_id in user_ids}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        failed = sum(1 for success in results.values() if not success)
+        self.logger.info(f"Bulk deactivation finished: {len(results) - failed} succeeded, {failed} failed")
+        return results
+    
     def forget_user(self, user_id: int) -> bool:
         """
         Permanently delete a requester and the tickets that they requested.
@@ -630,9 +833,11 @@ class UserManager:
             # Check if the operation was successful
             if success:
                 self.logger.info(f"Successfully forgot (permanently deleted) requester {user_id}")
+                self._invalidate_cached_user(user_id)
+                self._agent_status.pop(user_id, None)
                 
                 # Remove the user from recent users if present
-                self.recent_users = [u for u in self.recent_users if u.get("id") != user_id]
+                self.recent_users.pop(user_id, None)
                 
                 return True
             else:
@@ -679,12 +884,14 @@ class UserManager:
             # Check if the operation was successful
             if response and not response.get("error"):
                 self.logger.info(f"Successfully activated user {user_id}")
+                self._invalidate_cached_user(user_id)
+                self._agent_status.pop(user_id, None)
+                self._agent_ids = None
                 
                 # Update the cached user if in recent users
-                for i, user in enumerate(self.recent_users):
-                    if user.get("id") == user_id:
-                        self.recent_users[i]["active"] = True
-                        break
+                recent_user = self.recent_users.get(user_id)
+                if recent_user:
+                    recent_user["active"] = True
                 
                 return True
             else:
@@ -734,31 +941,110 @@ class UserManager:
         Returns:
             True if successful, False otherwise
         """
+        if self.dry_run:
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("DRY RUN: Would add user %s to group %s", user_id, group_id)
+            return True
+        
+        self.logger.info("Adding user %s to group %s", user_id, group_id)
+        
         try:
-            self.logger.info(f"Adding user {user_id} to group {group_id}")
-            
-            if self.dry_run:
-                self.logger.info(f"DRY RUN: Would add user {user_id} to group {group_id}")
-                return True
-            
             # Make the API request to add user to group
             response = self.api_client.post(
                 f"users/{user_id}/groups",
                 data={"group_ids": [group_id]},
                 workspace_id=self.workspace_id
             )
+        except Exception as e:
+            self.logger.error("Error adding user %s to group %s: %s", user_id, group_id, e)
+            return False
+        
+        return self._check_success(
+            response,
+            "Successfully added user %s to group %s",
+            "Failed to add user %s to group %s",
+            user_id, group_id
+        )
+    
+    def add_user_to_groups(self, user_id: int, group_ids: List[int]) -> bool:
+        """
+        Add a user to several groups with a single request.
+        
+        Args:
+            user_id: ID of the user
+            group_ids: IDs of the groups
             
-            # Check if the operation was successful
-            if response and response.get("success", False):
-                self.logger.info(f"Successfully added user {user_id} to group {group_id}")
-                return True
-            else:
-                self.logger.warning(f"Failed to add user {user_id} to group {group_id}")
-                return False
-                
+        Returns:
+            True if successful, False otherwise
+        """
+        if not group_ids:
+            return True
+        
+        if self.dry_run:
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("DRY RUN: Would add user %s to groups %s", user_id, group_ids)
+            return True
+        
+        self.logger.info("Adding user %s to groups %s", user_id, group_ids)
+        
+        try:
+            # The group membership endpoint takes a list, so all groups go in one call
+            response = self.api_client.post(
+                f"users/{user_id}/groups",
+                data={"group_ids": list(group_ids)},
+                workspace_id=self.workspace_id
+            )
         except Exception as e:
-            self.logger.error(f"Error adding user {user_id} to group {group_id}: {str(e)}")
+            self.logger.error("Error adding user %s to groups %s: %s", user_id, group_ids, e)
             return False
+        
+        return self._check_success(
+            response,
+            "Successfully added user %s to groups %s",
+            "Failed to add user %s to groups %s",
+            user_id, group_ids
+        )
+    
+    def add_group_memberships(
+        self,
+        memberships: List[Tuple[int, int]],
+        max_workers: Optional[int] = None
+    ) -> Dict[Tuple[int, int], bool]:
+        """
+        Add many (user ID, group ID) memberships, one request per user.
+        
+        Memberships for the same user are coalesced into a single call, and
+        different users are processed concurrently.
+        
+        Args:
+            memberships: List of (user_id, group_id) pairs
+            max_workers: Number of users processed at once (defaults to BULK_WORKERS)
+            
+        Returns:
+            Mapping of each (user_id, group_id) pair to True if added, False otherwise
+        """
+        if not memberships:
+            return {}
+        
+        # Group IDs per user, keeping first-seen order and dropping duplicates
+        groups_by_user: Dict[int, Dict[int, None]] = {}
+        for user_id, group_id in memberships:
+            groups_by_user.setdefault(user_id, {})[group_id] = None
+        
+        self.logger.info("Adding %s group memberships for %s users", len(memberships), len(groups_by_user))
+        results = dict.fromkeys(memberships, False)
+        with ThreadPoolExecutor(max_workers=max_workers or self.BULK_WORKERS) as executor:
+            futures = {
+                executor.submit(self.add_user_to_groups, user_id, list(group_ids)): user_id
+                for user_id, group_ids in groups_by_user.items()
+            }
+            for future in as_completed(futures):
+                user_id = futures[future]
+                success = future.result()
+                for group_id in groups_by_user[user_id]:
+                    results[(user_id, group_id)] = success
+        
+        return results
     
     def remove_user_from_group(self, user_id: int, group_id: int) -> bool:
         """
@@ -771,30 +1057,29 @@ class UserManager:
         Returns:
             True if successful, False otherwise
         """
+        if self.dry_run:
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("DRY RUN: Would remove user %s from group %s", user_id, group_id)
+            return True
+        
+        self.logger.info("Removing user %s from group %s", user_id, group_id)
+        
         try:
-            self.logger.info(f"Removing user {user_id} from group {group_id}")
-            
-            if self.dry_run:
-                self.logger.info(f"DRY RUN: Would remove user {user_id} from group {group_id}")
-                return True
-            
             # Make the API request to remove user from group
             response = self.api_client.delete(
                 f"users/{user_id}/groups/{group_id}",
                 workspace_id=self.workspace_id
             )
-            
-            # Check if the operation was successful
-            if response and response.get("success", False):
-                self.logger.info(f"Successfully removed user {user_id} from group {group_id}")
-                return True
-            else:
-                self.logger.warning(f"Failed to remove user {user_id} from group {group_id}")
-                return False
-                
         except Exception as e:
-            self.logger.error(f"Error removing user {user_id} from group {group_id}: {str(e)}")
+            self.logger.error("Error removing user %s from group %s: %s", user_id, group_id, e)
             return False
+        
+        return self._check_success(
+            response,
+            "Successfully removed user %s from group %s",
+            "Failed to remove user %s from group %s",
+            user_id, group_id
+        )
     
     def force_password_reset(self, user_id: int) -> bool:
         """
@@ -806,40 +1091,91 @@ class UserManager:
         Returns:
             True if successful, False otherwise
         """
+        if self.dry_run:
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("DRY RUN: Would force password reset for user %s", user_id)
+            return True
+        
+        self.logger.info("Forcing password reset for user %s", user_id)
+        
         try:
-            self.logger.info(f"Forcing password reset for user {user_id}")
-            
-            if self.dry_run:
-                self.logger.info(f"DRY RUN: Would force password reset for user {user_id}")
-                return True
-            
             # Make the API request to force password reset
             response = self.api_client.post(
                 f"users/{user_id}/force_password_reset",
                 data={},
                 workspace_id=self.workspace_id
             )
-            
-            # Check if the operation was successful
-            if response and response.get("success", False):
-                self.logger.info(f"Successfully forced password reset for user {user_id}")
-                return True
-            else:
-                self.logger.warning(f"Failed to force password reset for user {user_id}")
-                return False
-                
         except Exception as e:
-            self.logger.error(f"Error forcing password reset for user {user_id}: {str(e)}")
+            self.logger.error("Error forcing password reset for user %s: %s", user_id, e)
             return False
+        
+        return self._check_success(
+            response,
+            "Successfully forced password reset for user %s",
+            "Failed to force password reset for user %s",
+            user_id
+        )
+    
+    def force_password_reset_bulk(
+        self,
+        user_ids: List[int],
+        max_workers: Optional[int] = None
+    ) -> Dict[int, bool]:
+        """
+        Force a password reset for several users concurrently.
+        
+        At most max_workers resets are in flight at once; rate limit responses are
+        handled by the API client as for single calls.
+        
+        Args:
+            user_ids: IDs of the users
+            max_workers: Number of resets sent at once (defaults to BULK_WORKERS)
+            
+        Returns:
+            Mapping of user ID to True if the reset was forced, False otherwise
+        """
+        if not user_ids:
+            return {}
+        
+        self.logger.info("Forcing password reset for %s users", len(user_ids))
+        results = dict.fromkeys(user_ids, False)  # Keep the caller's order
+        with ThreadPoolExecutor(max_workers=max_workers or self.BULK_WORKERS) as executor:
+            futures = {executor.submit(self.force_password_reset, user_id): user_id for user_id in results}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        failed = sum(1 for success in results.values() if not success)
+        self.logger.info("Bulk password reset finished: %s succeeded, %s failed", len(results) - failed, failed)
+        return results
+    
+    def _check_success(self, response: Any, success_msg: str, failure_msg: str, *args: Any) -> bool:
+        """
+        Log and report whether a mutation request succeeded.
+        
+        Args:
+            response: Value returned by the API client (True for 204 No Content)
+            success_msg: %-style message logged at INFO on success
+            failure_msg: %-style message logged at WARNING on failure
+            *args: Arguments for both messages
+            
+        Returns:
+            True if the response indicates success, False otherwise
+        """
+        ok = response is True or (isinstance(response, dict) and response.get("success", False))
+        if ok:
+            self.logger.info(success_msg, *args)
+        else:
+            self.logger.warning(failure_msg, *args)
+        return bool(ok)
     
     def get_recent_users(self) -> List[Dict[str, Any]]:
         """
         Get recently accessed users.
         
         Returns:
-            List of recent user dictionaries
+            List of recent user dictionaries, most recent first
         """
-        return self.recent_users.copy()
+        return list(reversed(self.recent_users.values()))
     
     def get_inactive_users(self, days_threshold: int = 90) -> List[Dict[str, Any]]:
         """
@@ -857,6 +1193,145 @@ class UserManager:
         self.logger.warning("get_inactive_users method not fully implemented")
         return []
     
+    def _get_cached_user(self, cache: Dict, key: Any) -> Optional[Dict[str, Any]]:
+        """
+        Get a user from a lookup cache if the entry hasn't expired.
+        
+        Args:
+            cache: Lookup cache to read
+            key: User ID or lowercased email
+            
+        Returns:
+            Cached user dictionary, or None if missing or expired
+        """
+        with self._cache_lock:
+            entry = cache.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[0] >= self.USER_CACHE_TTL:
+                del cache[key]
+                return None
+            return entry[1]
+    
+    def _cache_user(self, cache: Dict, key: Any, user: Dict[str, Any]) -> None:
+        """
+        Store a user in a lookup cache, evicting the oldest entry when full.
+        
+        Args:
+            cache: Lookup cache to write
+            key: User ID or lowercased email
+            user: User dictionary to store
+        """
+        with self._cache_lock:
+            cache.pop(key, None)
+            cache[key] = (time.time(), user)
+            if len(cache) > self.USER_CACHE_SIZE:
+                del cache[next(iter(cache))]
+    
+    def _remember_missing_user(self, user_id: int) -> None:
+        """
+        Remember that a user ID wasn't found, evicting the oldest entry when full.
+        
+        Args:
+            user_id: User ID that both endpoints answered with 404
+        """
+        with self._cache_lock:
+            self._missing_users.pop(user_id, None)
+            self._missing_users[user_id] = time.time()
+            if len(self._missing_users) > self.MISSING_USER_CACHE_SIZE:
+                del self._missing_users[next(iter(self._missing_users))]
+    
+    def _invalidate_cached_user(self, user_id: int) -> None:
+        """
+        Drop a user from the lookup caches after it has been changed.
+        
+        Args:
+            user_id: ID of the changed user
+        """
+        with self._cache_lock:
+            self._id_cache.pop(user_id, None)
+            self._missing_users.pop(user_id, None)
+            # Listings hold a copy of the user as well, so fetch them again on next use
+            self._roster_cache.clear()
+            stale_emails = [email for email, (_, user) in self._email_cache.items() if user.get("id") == user_id]
+            for email in stale_emails:
+                del self._email_cache[email]
+    
+    def _get_roster_index(self, endpoint: str) -> _Roster:
+        """
+        Get the users from a list endpoint along with their lowercased names.
+        
+        Reads at most ROSTER_MAX_PAGES pages so a name search stays a handful of
+        requests on large tenants.
+        
+        Args:
+            endpoint: 'requesters' or 'agents'
+            
+        Returns:
+            _Roster of users with parallel first name, last name and ID lists
+            
+        Raises:
+            Exception if a page can't be fetched
+        """
+        cache_key = (endpoint, self.workspace_id)
+        entry = self._roster_cache.get(cache_key)
+        if entry and time.time() - entry[0] < self.ROSTER_CACHE_TTL:
+            self.logger.debug(f"Using cached {endpoint} list")
+            return entry[1]
+        
+        # Normalize names page by page as they arrive rather than in extra passes at the end
+        roster = _Roster([], [], [], [])
+        add_first_name = roster.first_names.append
+        add_last_name = roster.last_names.append
+        add_id = roster.ids.append
+        for batch in self._iter_user_pages(endpoint, max_pages=self.ROSTER_MAX_PAGES):
+            roster.users.extend(batch)
+            for user in batch:
+                get = user.get
+                add_first_name((get("first_name") or "").lower())
+                add_last_name((get("last_name") or "").lower())
+                add_id(get("id"))
+        
+        if len(roster.users) >= self.ROSTER_MAX_PAGES * 100:
+            self.logger.info(f"Name search limited to the first {len(roster.users)} {endpoint}")
+        
+        self._roster_cache[cache_key] = (time.time(), roster)
+        return roster
+    
+    def _iter_user_pages(self, endpoint: str, max_pages: Optional[int] = None):
+        """
+        Page through a user list endpoint, yielding one page at a time.
+        
+        Args:
+            endpoint: 'requesters' or 'agents'
+            max_pages: Stop after this many pages (None reads them all)
+            
+        Yields:
+            List of user dictionaries for each non-empty page
+            
+        Raises:
+            Exception if a page can't be fetched
+        """
+        page = 1
+        per_page = 100  # Maximum allowed by API
+        api_get = self.api_client.get
+        workspace_id = self.workspace_id
+        
+        while True:
+            response = api_get(
+                endpoint,
+                params={"per_page": per_page, "page": page},
+                workspace_id=workspace_id
+            )
+            batch = response.get(endpoint, []) or []
+            if batch:
+                yield batch
+            
+            # A short page means we've reached the end
+            if len(batch) < per_page or (max_pages is not None and page >= max_pages):
+                break
+            page += 1
+    
     def _add_to_recent_users(self, user: Dict[str, Any]) -> None:
         """
         Add a user to the recent users cache.
@@ -864,15 +1339,15 @@ class UserManager:
         Args:
             user: User dictionary to add
         """
-        # Remove the user if already in the list
-        self.recent_users = [u for u in self.recent_users if u.get("id") != user.get("id")]
-        
-        # Add the user to the beginning of the list
-        self.recent_users.insert(0, user)
-        
-        # Trim the list if it exceeds the maximum size
-        if len(self.recent_users) > self.max_recent_users:
-            self.recent_users = self.recent_users[:self.max_recent_users]
+        with self._cache_lock:
+            # Add or replace the user and mark it as the most recent
+            user_id = user.get("id")
+            self.recent_users[user_id] = user
+            self.recent_users.move_to_end(user_id)
+            
+            # Drop the least recent user if we're over the maximum size
+            if len(self.recent_users) > self.max_recent_users:
+                self.recent_users.popitem(last=False)
     
     def _is_valid_email(self, email: str) -> bool:
         """
@@ -884,8 +1359,7 @@ class UserManager:
         Returns:
             True if valid, False otherwise
         """
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(email_pattern, email))
+        return _EMAIL_RE.match(email) is not None
     
     def get_all_agents(self) -> List[Dict[str, Any]]:
         """
@@ -895,48 +1369,77 @@ class UserManager:
             List of all agents in the system
         """
         self.logger.info("Getting all agents")
+        agents = list(self.iter_all_agents())
+        self.logger.info("Retrieved %s agents", len(agents))
+        return agents
+    
+    def iter_all_agents(self):
+        """
+        Yield all agents from FreshService API as their pages arrive.
+        
+        Yields:
+            Agent dictionaries, in page order
+        """
+        
+        per_page = 100  # Maximum allowed by API
+        
+        def fetch_page(page):
+            """Return (agents, has_next, total) for a page; agents is None if the request failed."""
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Fetching agents page %s", page)
+            try:
+                response = self.api_client.get(
+                    "agents",
+                    params={"per_page": per_page, "page": page},
+                    workspace_id=self.workspace_id
+                )
+            except Exception as e:
+                self.logger.error("Error retrieving agents page %s: %s", page, e)
+                return None, False, None
+            
+            if not isinstance(response, dict) or 'agents' not in response:
+                self.logger.warning("Unexpected response format from agents endpoint: %s", response)
+                return None, False, None
+            total = response.get('total')
+            return (
+                response.get('agents', []),
+                self.api_client.last_response_has_next_page(),
+                total if isinstance(total, int) else None
+            )
+        
+        def is_last(batch, has_next):
+            # Link header is authoritative when present; otherwise a short page ends the list
+            return not batch or has_next is False or len(batch) < per_page
         
         try:
-            agents = []
-            page = 1
-            per_page = 100  # Maximum allowed by API
-            
-            while True:
-                self.logger.debug(f"Fetching agents page {page}")
-                
-                try:
-                    # Get page of agents
-                    response = self.api_client.get(
-                        "agents",
-                        params={"per_page": per_page, "page": page},
-                        workspace_id=self.workspace_id
-                    )
-                    
-                    if not isinstance(response, dict) or 'agents' not in response:
-                        self.logger.warning(f"Unexpected response format from agents endpoint: {response}")
-                        break
-                        
-                    batch = response.get('agents', [])
-                    
-                    if not batch:
-                        # No more agents to retrieve
-                        break
-                        
-                    agents.extend(batch)
-                    
-                    # Check if there are more pages
-                    if len(batch) < per_page:
-                        # If we got fewer items than requested, this must be the last page
-                        break
-                        
-                    page += 1
-                except Exception as e:
-                    self.logger.error(f"Error retrieving agents page {page}: {str(e)}")
-                    break
-            
-            self.logger.info(f"Retrieved {len(agents)} agents")
-            return agents
+            # The first page tells us whether there is anything more to fetch
+            batch, has_next, total = fetch_page(1)
+            if batch:
+                yield from batch
+            
+            if not is_last(batch, has_next):
+                window = self.PAGE_FETCH_WORKERS
+                with ThreadPoolExecutor(max_workers=window) as executor:
+                    if total is not None:
+                        # A reported total gives the exact page count, so fetch the rest at once
+                        last_page = (total + per_page - 1) // per_page
+                        for batch, _, _ in executor.map(fetch_page, range(2, last_page + 1)):
+                            if not batch:
+                                break
+                            yield from batch
+                    else:
+                        # Otherwise request pages in windows and stop at the first
+                        # last, short, empty or failed page
+                        next_page = 2
+                        done = False
+                        while not done:
+                            for batch, has_next, _ in executor.map(fetch_page, range(next_page, next_page + window)):
+                                if batch:
+                                    yield from batch
+                                if is_last(batch, has_next):
+                                    done = True
+                                    break
+                            next_page += window
             
         except Exception as e:
-            self.logger.error(f"Error retrieving all agents: {str(e)}")
-            return [] 
\ No newline at end of file
+            self.logger.error("Error retrieving all agents: %s", e) 
\ No newline at end of file
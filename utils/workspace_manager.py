@@ -7,6 +7,7 @@ Workspace Manager Module
 Handles workspace discovery and management.
 """
 
+import time
 import logging
 from typing import Dict, List, Optional, Any
 
@@ -19,6 +20,17 @@ class WorkspaceManager:
     Provides functionality to discover and switch between workspaces.
     """
     
+    # Seconds before the cached workspace list is fetched again
+    WORKSPACE_CACHE_TTL = 300
+    # Unknown IDs/names remembered per list, so repeated misses warn only once
+    MISSING_WORKSPACE_CACHE_SIZE = 256
+    # Used when the API returns no workspaces or can't be reached
+    _DEFAULT_WORKSPACE = {
+        "id": 1,  # Default workspace ID is typically 1
+        "name": "Default Workspace",
+        "description": "Default FreshService workspace"
+    }
+    
     def __init__(self, api_client: FreshServiceAPI, logger: logging.Logger):
         """
         Initialize the workspace manager.
@@ -30,6 +42,13 @@ class WorkspaceManager:
         self.api_client = api_client
         self.logger = logger
         self._workspaces_cache = None
+        self._cache_ts: Optional[float] = None  # None forces the next call to fetch
+        self._workspaces_etag: Optional[str] = None
+        self._by_id: Dict[int, Dict[str, Any]] = {}
+        self._by_name: Dict[str, Dict[str, Any]] = {}
+        # Lookups that missed against the current list (insertion-ordered for eviction)
+        self._missing_ids: Dict[int, None] = {}
+        self._missing_names: Dict[str, None] = {}
         self.current_workspace_id = None
         self._initialize_current_workspace()
     
@@ -53,46 +72,83 @@ class WorkspaceManager:
             return self.get_workspace_by_id(self.current_workspace_id)
         return None
     
+    def _set_workspaces_cache(self, workspaces: List[Dict[str, Any]], etag: Optional[str] = None) -> None:
+        """
+        Store the workspace list and rebuild the ID and name lookup maps.
+        
+        Args:
+            workspaces: List of workspace dictionaries
+            etag: ETag of the response the list came from, if any
+        """
+        self._workspaces_cache = workspaces
+        self._workspaces_etag = etag
+        self._cache_ts = time.monotonic()
+        # Built in reverse so the first workspace wins on duplicate keys, as the old scan did
+        self._by_id = {w.get("id"): w for w in reversed(workspaces)}
+        self._by_name = {w.get("name"): w for w in reversed(workspaces)}
+        self._missing_ids = {}
+        self._missing_names = {}
+    
+    def _remember_missing(self, missing: Dict[Any, None], key: Any) -> bool:
+        """
+        Record a lookup that found no workspace.
+        
+        Args:
+            missing: Missing-key cache to record the key in
+            key: Workspace ID or name that wasn't found
+            
+        Returns:
+            True if this is the first miss for the key, False if it was already known
+        """
+        if key in missing:
+            return False
+        if len(missing) >= self.MISSING_WORKSPACE_CACHE_SIZE:
+            missing.pop(next(iter(missing)))  # Evict the oldest miss
+        missing[key] = None
+        return True
+    
     def get_workspaces(self) -> List[Dict[str, Any]]:
         """
         Fetch all available workspaces from FreshService.
-        Uses a cache to avoid redundant API calls.
+        Uses a cache to avoid redundant API calls; entries older than
+        WORKSPACE_CACHE_TTL seconds are revalidated with the stored ETag, so an
+        unchanged list costs a 304 instead of the full payload.
         
         Returns:
             List of workspace dictionaries
         """
-        if self._workspaces_cache is None:
+        fresh = (self._workspaces_cache is not None
+                 and self._cache_ts is not None
+                 and time.monotonic() - self._cache_ts <= self.WORKSPACE_CACHE_TTL)
+        
+        if not fresh:
             self.logger.info("Fetching available workspaces...")
             try:
-                response = self.api_client.get("workspaces")
+                # The ETag is only kept alongside a list fetched from the API
+                response = self.api_client.get("workspaces", etag=self._workspaces_etag)
                 self.logger.debug(f"Workspace API Response: {response}")
                 
+                if response.get("not_modified"):
+                    self.logger.info("Workspaces unchanged since last fetch")
+                    self._cache_ts = time.monotonic()
+                    return self._workspaces_cache
+                
                 workspaces = response.get("workspaces", [])
                 
                 if workspaces:
                     self.logger.info(f"Found {len(workspaces)} workspaces")
-                    self._workspaces_cache = workspaces
+                    self._set_workspaces_cache(workspaces, self.api_client.last_response_etag())
                 else:
                     self.logger.warning("No workspaces found in the API response")
                     self.logger.debug(f"Full API response: {response}")
                     # If no workspaces found, try using a default workspace
-                    default_workspace = {
-                        "id": 1,  # Default workspace ID is typically 1
-                        "name": "Default Workspace",
-                        "description": "Default FreshService workspace"
-                    }
-                    self._workspaces_cache = [default_workspace]
+                    self._set_workspaces_cache([dict(self._DEFAULT_WORKSPACE)])
                     self.logger.info("Using default workspace as fallback")
             except Exception as e:
                 self.logger.error(f"Error fetching workspaces: {str(e)}")
                 self.logger.debug("Attempting to use default workspace...")
                 # If API call fails, try using a default workspace
-                default_workspace = {
-                    "id": 1,  # Default workspace ID is typically 1
-                    "name": "Default Workspace",
-                    "description": "Default FreshService workspace"
-                }
-                self._workspaces_cache = [default_workspace]
+                self._set_workspaces_cache([dict(self._DEFAULT_WORKSPACE)])
                 self.logger.info("Using default workspace as fallback")
         
         return self._workspaces_cache
@@ -107,12 +163,13 @@ class WorkspaceManager:
         Returns:
             Workspace dictionary if found, None otherwise
         """
-        workspaces = self.get_workspaces()
-        for workspace in workspaces:
-            if workspace.get("id") == workspace_id:
-                return workspace
+        self.get_workspaces()
+        workspace = self._by_id.get(workspace_id)
+        if workspace is not None:
+            return workspace
         
-        self.logger.warning(f"Workspace with ID {workspace_id} not found")
+        if self._remember_missing(self._missing_ids, workspace_id):
+            self.logger.warning(f"Workspace with ID {workspace_id} not found")
         return None
     
     def get_workspace_by_name(self, workspace_name: str) -> Optional[Dict[str, Any]]:
@@ -125,24 +182,25 @@ class WorkspaceManager:
         Returns:
             Workspace dictionary if found, None otherwise
         """
-        workspaces = self.get_workspaces()
-        for workspace in workspaces:
-            if workspace.get("name") == workspace_name:
-                return workspace
+        self.get_workspaces()
+        workspace = self._by_name.get(workspace_name)
+        if workspace is not None:
+            return workspace
         
-        self.logger.warning(f"Workspace with name '{workspace_name}' not found")
+        if self._remember_missing(self._missing_names, workspace_name):
+            self.logger.warning(f"Workspace with name '{workspace_name}' not found")
         return None
     
     def refresh_workspaces(self) -> List[Dict[str, Any]]:
         """
         Force refresh of workspaces from the API.
-        Clears the cache and fetches fresh data.
+        Expires the cache and fetches fresh data (a conditional request when an ETag is known).
         
         Returns:
             Updated list of workspace dictionaries
         """
         self.logger.info("Refreshing workspaces...")
-        self._workspaces_cache = None
+        self._cache_ts = None
         return self.get_workspaces()
     
     def list_workspace_details(self) -> None:
@@ -156,12 +214,15 @@ class WorkspaceManager:
             self.logger.info("No workspaces available")
             return
         
-        self.logger.info(f"Available Workspaces ({len(workspaces)}):")
+        # Build the listing first and log it as a single record
+        lines = [f"Available Workspaces ({len(workspaces)}):"]
         for workspace in workspaces:
             workspace_id = workspace.get("id")
             name = workspace.get("name")
             description = workspace.get("description", "No description")
             
-            self.logger.info(f"ID: {workspace_id} | Name: {name}")
-            self.logger.info(f"  Description: {description}")
-            self.logger.info("  -" * 30) 
\ No newline at end of file
+            lines.append(f"ID: {workspace_id} | Name: {name}")
+            lines.append(f"  Description: {description}")
+            lines.append("  -" * 30)
+        
+        self.logger.info("\n".join(lines)) 
\ No newline at end of file